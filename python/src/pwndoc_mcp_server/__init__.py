@@ -37,6 +37,7 @@ try:
     from pwndoc_mcp_server.client import (
         AuthenticationError,
         NotFoundError,
+        PwnDocAsyncClient,
         PwnDocClient,
         PwnDocError,
         RateLimitError,
@@ -50,7 +51,6 @@ try:
     )
     from pwndoc_mcp_server.logging_config import LogLevel, get_logger, setup_logging
     from pwndoc_mcp_server.server import (
-        TOOL_DEFINITIONS,
         PwnDocMCPServer,
         create_server,
         get_tool_definitions,
@@ -60,6 +60,20 @@ finally:
     sys.stdout = _original_stdout
     _devnull.close()
 
+
+def __getattr__(name):
+    """Resolve TOOL_DEFINITIONS lazily (PEP 562).
+
+    Building the definitions instantiates a server and registers ~80 tools;
+    deferring it keeps package import fast for consumers that never need it.
+    """
+    if name == "TOOL_DEFINITIONS":
+        from pwndoc_mcp_server.server import get_tool_definitions
+
+        return get_tool_definitions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Version
     "__version__",
@@ -71,6 +85,7 @@ __all__ = [
     "save_config",
     # Client
     "PwnDocClient",
+    "PwnDocAsyncClient",
     "PwnDocError",
     "AuthenticationError",
     "RateLimitError",
@@ -4,6 +4,7 @@ PwnDoc API Client - HTTP client for PwnDoc REST API.
 Handles authentication, rate limiting, retries, and all API endpoints.
 """
 
+import asyncio
 import logging
 import time
 from collections import deque
@@ -148,6 +149,7 @@ class PwnDocClient:
             timeout=self.config.timeout,
             verify=self.config.verify_ssl,
             follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
         )
 
         logger.debug(f"PwnDocClient initialized for {self.base_url}")
@@ -1120,3 +1122,983 @@ class PwnDocClient:
                 results.append(enhanced_finding)
 
         return results
+
+
+class PwnDocAsyncClient:
+    """
+    Async HTTP client for PwnDoc REST API.
+
+    Mirrors :class:`PwnDocClient` on top of ``httpx.AsyncClient`` with a
+    persistent keep-alive connection pool, for library consumers running
+    inside an event loop. The MCP server itself dispatches tool calls
+    through the sync client on worker threads.
+
+    Example:
+        >>> async with PwnDocAsyncClient(config) as client:
+        ...     audits = await client.list_audits()
+    """
+
+    def __init__(self, config: Optional[Config] = None, **kwargs):
+        """
+        Initialize async PwnDoc client.
+
+        Args:
+            config: Configuration object (if provided, kwargs are ignored)
+            **kwargs: Configuration parameters (url, token, etc.)
+        """
+        self.config = config if config is not None else Config(**kwargs)
+
+        self.base_url = self.config.url.rstrip("/")
+        self._token: Optional[str] = self.config.token or None
+        self._token_expires: Optional[datetime] = None
+        self._refresh_token: Optional[str] = None
+
+        self.rate_limiter = RateLimiter(
+            self.config.rate_limit_requests, self.config.rate_limit_period
+        )
+
+        # Persistent keep-alive pool shared by all requests from this client
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+        logger.debug(f"PwnDocAsyncClient initialized for {self.base_url}")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "PwnDocAsyncClient":
+        """Create async client from config object."""
+        return cls(config=config)
+
+    @property
+    def url(self) -> str:
+        """Get the base URL."""
+        return self.base_url
+
+    @property
+    def token(self) -> Optional[str]:
+        """Get the current token."""
+        return self._token
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Check if client has valid authentication."""
+        if not self._token:
+            return False
+        if self._token_expires and datetime.now() >= self._token_expires:
+            return False
+        return True
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers with authentication."""
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if self._token:
+            # PwnDoc expects JWT token in Cookie header
+            headers["Cookie"] = f"token=JWT {self._token}"
+        return headers
+
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with PwnDoc and obtain JWT token.
+
+        Same credential priority as :meth:`PwnDocClient.authenticate`:
+        username/password first, pre-configured token as fallback.
+
+        Returns:
+            bool: True if authentication succeeded
+
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        if self.config.username and self.config.password:
+            try:
+                response = await self._client.post(
+                    "/api/users/token",
+                    json={
+                        "username": self.config.username,
+                        "password": self.config.password,
+                    },
+                    headers={"Content-Type": "application/json"},
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    self._token = data.get("datas", {}).get("token")
+
+                    if "refreshToken" in response.cookies:
+                        self._refresh_token = response.cookies["refreshToken"]
+
+                    self._token_expires = datetime.now() + timedelta(hours=1)
+
+                    logger.info("Authentication successful via username/password")
+                    return True
+                else:
+                    raise AuthenticationError(
+                        f"Authentication failed: {response.status_code} - {response.text}"
+                    )
+            except httpx.RequestError as e:
+                raise AuthenticationError(f"Connection error: {e}")
+
+        if self.config.token:
+            self._token = self.config.token
+            logger.info("Using pre-configured token (no automatic refresh)")
+            return True
+
+        raise AuthenticationError("No credentials configured (provide username/password or token)")
+
+    async def refresh_authentication(self) -> bool:
+        """Refresh the authentication token."""
+        if self._refresh_token:
+            try:
+                response = await self._client.get(
+                    "/api/users/refreshtoken",
+                    cookies={"refreshToken": self._refresh_token},
+                )
+                if response.status_code == 200:
+                    data = response.json()
+                    self._token = data.get("datas", {}).get("token")
+                    self._token_expires = datetime.now() + timedelta(hours=1)
+                    logger.debug("Token refreshed")
+                    return True
+            except Exception as e:
+                logger.warning(f"Token refresh failed: {e}")
+
+        return await self.authenticate()
+
+    async def _ensure_authenticated(self):
+        """Ensure we have valid authentication."""
+        if not self.is_authenticated:
+            if self._refresh_token:
+                await self.refresh_authentication()
+            else:
+                await self.authenticate()
+
+    async def _wait_for_rate_limit(self):
+        """Wait if rate limited (without blocking the event loop)."""
+        while not self.rate_limiter.acquire():
+            wait_time = self.rate_limiter.wait_time()
+            logger.debug(f"Rate limited, waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an API request with retries and error handling.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            **kwargs: Additional request arguments
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            PwnDocError: On API errors
+        """
+        await self._ensure_authenticated()
+        await self._wait_for_rate_limit()
+
+        url = endpoint if endpoint.startswith("/") else f"/{endpoint}"
+        headers = self._get_headers()
+        headers.update(kwargs.pop("headers", {}))
+
+        last_error = None
+        for attempt in range(self.config.max_retries):
+            try:
+                response = await self._client.request(method, url, headers=headers, **kwargs)
+
+                if response.status_code == 200:
+                    try:
+                        return cast(Dict[str, Any], response.json())
+                    except Exception:
+                        return {"raw": response.text}
+                elif response.status_code == 401:
+                    # Token expired, try to refresh
+                    await self.refresh_authentication()
+                    headers["Authorization"] = f"Bearer {self._token}"
+                    continue
+                elif response.status_code == 404:
+                    raise NotFoundError(f"Resource not found: {endpoint}")
+                elif response.status_code == 429:
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    raise RateLimitError(f"Rate limited, retry after {retry_after}s")
+                else:
+                    raise PwnDocError(f"API error: {response.status_code} - {response.text}")
+
+            except httpx.RequestError as e:
+                last_error = e
+                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(self.config.retry_delay * (2**attempt))
+
+        raise PwnDocError(f"Request failed after {self.config.max_retries} retries: {last_error}")
+
+    async def _get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make GET request."""
+        return await self._request("GET", endpoint, **kwargs)
+
+    async def _post(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make POST request."""
+        return await self._request("POST", endpoint, **kwargs)
+
+    async def _put(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make PUT request."""
+        return await self._request("PUT", endpoint, **kwargs)
+
+    async def _delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make DELETE request."""
+        return await self._request("DELETE", endpoint, **kwargs)
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """
+        Test the connection to PwnDoc server.
+
+        Returns:
+            Dict with status and connection info
+
+        Example:
+            >>> result = await client.test_connection()
+            >>> if result["status"] == "ok":
+            ...     print(f"Connected as {result['user']}")
+        """
+        try:
+            await self._ensure_authenticated()
+
+            user_data = await self.get_current_user()
+
+            # Extract username from response (handle both direct and nested format)
+            if isinstance(user_data, dict):
+                if "datas" in user_data:
+                    username = user_data.get("datas", {}).get("username", "unknown")
+                else:
+                    username = user_data.get("username", "unknown")
+            else:
+                username = "unknown"
+
+            return {
+                "status": "ok",
+                "user": username,
+                "url": self.base_url,
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "url": self.base_url,
+            }
+
+    # =========================================================================
+    # AUDIT ENDPOINTS
+    # =========================================================================
+
+    async def list_audits(self, finding_title: Optional[str] = None) -> List[Dict]:
+        """List all audits, optionally filtered by finding title."""
+        response = await self._get("/api/audits")
+        audits = response.get("datas", [])
+
+        if finding_title:
+            filtered = []
+            for audit in audits:
+                for finding in audit.get("findings", []):
+                    if finding_title.lower() in finding.get("title", "").lower():
+                        filtered.append(audit)
+                        break
+            return filtered
+        return audits
+
+    async def get_audit(self, audit_id: str) -> Dict:
+        """Get detailed audit information."""
+        response = await self._get(f"/api/audits/{audit_id}")
+        return response.get("datas", {})
+
+    async def get_audit_general(self, audit_id: str) -> Dict:
+        """Get audit general information."""
+        response = await self._get(f"/api/audits/{audit_id}/general")
+        return response.get("datas", {})
+
+    async def create_audit(self, name: str, language: str, audit_type: str, **kwargs) -> Dict:
+        """Create a new audit."""
+        data = {"name": name, "language": language, "auditType": audit_type, **kwargs}
+        response = await self._post("/api/audits", json=data)
+        return response.get("datas", {})
+
+    async def update_audit_general(self, audit_id: str, **kwargs) -> Dict:
+        """Update audit general information."""
+        response = await self._put(f"/api/audits/{audit_id}/general", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_audit(self, audit_id: str) -> bool:
+        """Delete an audit."""
+        await self._delete(f"/api/audits/{audit_id}")
+        return True
+
+    async def generate_report(self, audit_id: str) -> bytes:
+        """Generate and download audit report."""
+        await self._ensure_authenticated()
+        response = await self._client.get(
+            f"/api/audits/{audit_id}/generate",
+            headers=self._get_headers(),
+        )
+        if response.status_code == 200:
+            return response.content
+        raise PwnDocError(f"Report generation failed: {response.status_code}")
+
+    async def get_audit_network(self, audit_id: str) -> Dict:
+        """Get audit network information."""
+        response = await self._get(f"/api/audits/{audit_id}/network")
+        return response.get("datas", {})
+
+    async def update_audit_network(self, audit_id: str, network_data: Dict) -> Dict:
+        """Update audit network information."""
+        response = await self._put(f"/api/audits/{audit_id}/network", json=network_data)
+        return response.get("datas", {})
+
+    async def toggle_audit_approval(self, audit_id: str) -> Dict:
+        """Toggle audit approval status."""
+        response = await self._put(f"/api/audits/{audit_id}/toggleApproval")
+        return response.get("datas", {})
+
+    async def update_review_status(self, audit_id: str, state: bool) -> Dict:
+        """Update audit review ready status."""
+        response = await self._put(
+            f"/api/audits/{audit_id}/updateReadyForReview", json={"state": state}
+        )
+        return response.get("datas", {})
+
+    async def get_audit_sections(self, audit_id: str) -> Dict:
+        """Get audit sections."""
+        response = await self._get(f"/api/audits/{audit_id}/sections")
+        return response.get("datas", {})
+
+    async def update_audit_sections(self, audit_id: str, sections: Dict) -> Dict:
+        """Update audit sections."""
+        response = await self._put(f"/api/audits/{audit_id}/sections", json=sections)
+        return response.get("datas", {})
+
+    # =========================================================================
+    # FINDING ENDPOINTS
+    # =========================================================================
+
+    async def get_findings(self, audit_id: str) -> List[Dict]:
+        """Get all findings for an audit."""
+        response = await self._get(f"/api/audits/{audit_id}/findings")
+        return response.get("datas", [])
+
+    async def get_finding(self, audit_id: str, finding_id: str) -> Dict:
+        """Get specific finding details."""
+        response = await self._get(f"/api/audits/{audit_id}/findings/{finding_id}")
+        return response.get("datas", {})
+
+    async def create_finding(self, audit_id: str, **kwargs) -> Dict:
+        """Create a new finding."""
+        response = await self._post(f"/api/audits/{audit_id}/findings", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_finding(self, audit_id: str, finding_id: str, **kwargs) -> Dict:
+        """Update an existing finding."""
+        response = await self._put(f"/api/audits/{audit_id}/findings/{finding_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_finding(self, audit_id: str, finding_id: str) -> bool:
+        """Delete a finding."""
+        await self._delete(f"/api/audits/{audit_id}/findings/{finding_id}")
+        return True
+
+    async def sort_findings(self, audit_id: str, finding_order: List[str]) -> Dict:
+        """Reorder findings in an audit."""
+        response = await self._put(
+            f"/api/audits/{audit_id}/sortFindings", json={"findings": finding_order}
+        )
+        return response.get("datas", {})
+
+    async def move_finding(self, audit_id: str, finding_id: str, destination_audit_id: str) -> Dict:
+        """Move finding to another audit."""
+        response = await self._post(
+            f"/api/audits/{audit_id}/findings/{finding_id}/move/{destination_audit_id}"
+        )
+        return response.get("datas", {})
+
+    # =========================================================================
+    # CLIENT & COMPANY ENDPOINTS
+    # =========================================================================
+
+    async def list_clients(self) -> List[Dict]:
+        """List all clients."""
+        response = await self._get("/api/clients")
+        return response.get("datas", [])
+
+    async def create_client(self, **kwargs) -> Dict:
+        """Create a new client."""
+        response = await self._post("/api/clients", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_client(self, client_id: str, **kwargs) -> Dict:
+        """Update a client."""
+        response = await self._put(f"/api/clients/{client_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_client(self, client_id: str) -> bool:
+        """Delete a client."""
+        await self._delete(f"/api/clients/{client_id}")
+        return True
+
+    async def list_companies(self) -> List[Dict]:
+        """List all companies."""
+        response = await self._get("/api/companies")
+        return response.get("datas", [])
+
+    async def create_company(self, **kwargs) -> Dict:
+        """Create a new company."""
+        response = await self._post("/api/companies", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_company(self, company_id: str, **kwargs) -> Dict:
+        """Update a company."""
+        response = await self._put(f"/api/companies/{company_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_company(self, company_id: str) -> bool:
+        """Delete a company."""
+        await self._delete(f"/api/companies/{company_id}")
+        return True
+
+    # =========================================================================
+    # VULNERABILITY TEMPLATE ENDPOINTS
+    # =========================================================================
+
+    async def list_vulnerabilities(self) -> List[Dict]:
+        """List all vulnerability templates."""
+        response = await self._get("/api/vulnerabilities")
+        return response.get("datas", [])
+
+    async def get_vulnerabilities_by_locale(self, locale: str = "en") -> List[Dict]:
+        """Get vulnerability templates for a locale."""
+        response = await self._get(f"/api/vulnerabilities/{locale}")
+        return response.get("datas", [])
+
+    async def create_vulnerability(self, **kwargs) -> Dict:
+        """Create a vulnerability template."""
+        response = await self._post("/api/vulnerabilities", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_vulnerability(self, vuln_id: str, **kwargs) -> Dict:
+        """Update a vulnerability template."""
+        response = await self._put(f"/api/vulnerabilities/{vuln_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_vulnerability(self, vuln_id: str) -> bool:
+        """Delete a vulnerability template."""
+        await self._delete(f"/api/vulnerabilities/{vuln_id}")
+        return True
+
+    async def bulk_delete_vulnerabilities(self, vuln_ids: List[str]) -> bool:
+        """Bulk delete vulnerability templates."""
+        await self._delete("/api/vulnerabilities", json={"vulnIds": vuln_ids})
+        return True
+
+    async def export_vulnerabilities(self) -> Dict:
+        """Export all vulnerability templates."""
+        response = await self._get("/api/vulnerabilities/export")
+        return response.get("datas", {})
+
+    async def create_vulnerability_from_finding(self, **kwargs) -> Dict:
+        """Create vulnerability template from finding."""
+        response = await self._post("/api/vulnerabilities/from-finding", json=kwargs)
+        return response.get("datas", {})
+
+    async def get_vulnerability_updates(self) -> List[Dict]:
+        """Get available vulnerability template updates."""
+        response = await self._get("/api/vulnerabilities/updates")
+        return response.get("datas", [])
+
+    async def merge_vulnerability(self, vuln_id: str, update_id: str) -> Dict:
+        """Merge vulnerability template with update."""
+        response = await self._post(f"/api/vulnerabilities/{vuln_id}/merge/{update_id}")
+        return response.get("datas", {})
+
+    # =========================================================================
+    # USER ENDPOINTS
+    # =========================================================================
+
+    async def list_users(self) -> List[Dict]:
+        """List all users (admin only)."""
+        response = await self._get("/api/users")
+        return response.get("datas", [])
+
+    async def get_user(self, username: str) -> Dict:
+        """Get user by username."""
+        response = await self._get(f"/api/users/{username}")
+        return response.get("datas", {})
+
+    async def get_current_user(self) -> Dict:
+        """Get current authenticated user."""
+        response = await self._get("/api/users/me")
+        return response.get("datas", {})
+
+    async def create_user(self, **kwargs) -> Dict:
+        """Create a new user (admin only)."""
+        response = await self._post("/api/users", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_user(self, user_id: str, **kwargs) -> Dict:
+        """Update a user (admin only)."""
+        response = await self._put(f"/api/users/{user_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_current_user(self, **kwargs) -> Dict:
+        """Update current user profile."""
+        response = await self._put("/api/users/me", json=kwargs)
+        return response.get("datas", {})
+
+    async def list_reviewers(self) -> List[Dict]:
+        """List all reviewers."""
+        response = await self._get("/api/users/reviewers")
+        return response.get("datas", [])
+
+    async def get_totp(self) -> Dict:
+        """Get TOTP (2FA) status for current user."""
+        response = await self._get("/api/users/totp")
+        return response.get("datas", {})
+
+    async def setup_totp(self) -> Dict:
+        """Setup TOTP (2FA) for current user."""
+        response = await self._post("/api/users/totp")
+        return response.get("datas", {})
+
+    async def disable_totp(self, token: str) -> Dict:
+        """Disable TOTP (2FA) for current user."""
+        response = await self._delete("/api/users/totp", json={"token": token})
+        return response.get("datas", {})
+
+    # =========================================================================
+    # TEMPLATE & SETTINGS ENDPOINTS
+    # =========================================================================
+
+    async def list_templates(self) -> List[Dict]:
+        """List report templates."""
+        response = await self._get("/api/templates")
+        return response.get("datas", [])
+
+    async def create_template(self, name: str, ext: str, file_content: str) -> Dict:
+        """Create/upload a report template."""
+        response = await self._post(
+            "/api/templates", json={"name": name, "ext": ext, "file": file_content}
+        )
+        return response.get("datas", {})
+
+    async def update_template(self, template_id: str, **kwargs) -> Dict:
+        """Update a template."""
+        response = await self._put(f"/api/templates/{template_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_template(self, template_id: str) -> bool:
+        """Delete a template."""
+        await self._delete(f"/api/templates/{template_id}")
+        return True
+
+    async def download_template(self, template_id: str) -> bytes:
+        """Download a template file."""
+        await self._ensure_authenticated()
+        response = await self._client.get(
+            f"/api/templates/download/{template_id}",
+            headers=self._get_headers(),
+        )
+        return response.content
+
+    async def get_settings(self) -> Dict:
+        """Get system settings."""
+        response = await self._get("/api/settings")
+        return response.get("datas", {})
+
+    async def get_public_settings(self) -> Dict:
+        """Get public settings."""
+        response = await self._get("/api/settings/public")
+        return response.get("datas", {})
+
+    async def update_settings(self, settings: Dict) -> Dict:
+        """Update system settings."""
+        response = await self._put("/api/settings", json=settings)
+        return response.get("datas", {})
+
+    async def export_settings(self) -> Dict:
+        """Export all system settings."""
+        response = await self._get("/api/settings/export")
+        return response.get("datas", {})
+
+    async def import_settings(self, settings: Dict) -> Dict:
+        """Import/revert system settings."""
+        response = await self._post("/api/settings/import", json=settings)
+        return response.get("datas", {})
+
+    # =========================================================================
+    # DATA TYPE ENDPOINTS
+    # =========================================================================
+
+    async def list_languages(self) -> List[Dict]:
+        """List all languages."""
+        response = await self._get("/api/data/languages")
+        return response.get("datas", [])
+
+    async def list_audit_types(self) -> List[Dict]:
+        """List all audit types."""
+        response = await self._get("/api/data/audit-types")
+        return response.get("datas", [])
+
+    async def list_vulnerability_types(self) -> List[Dict]:
+        """List all vulnerability types."""
+        response = await self._get("/api/data/vulnerability-types")
+        return response.get("datas", [])
+
+    async def list_vulnerability_categories(self) -> List[Dict]:
+        """List all vulnerability categories."""
+        response = await self._get("/api/data/vulnerability-categories")
+        return response.get("datas", [])
+
+    async def list_sections(self) -> List[Dict]:
+        """List all section definitions."""
+        response = await self._get("/api/data/sections")
+        return response.get("datas", [])
+
+    async def list_custom_fields(self) -> List[Dict]:
+        """List all custom field definitions."""
+        response = await self._get("/api/data/custom-fields")
+        return response.get("datas", [])
+
+    async def list_roles(self) -> List[Dict]:
+        """List all user roles."""
+        response = await self._get("/api/data/roles")
+        return response.get("datas", [])
+
+    async def create_language(self, **kwargs) -> Dict:
+        """Create a new language."""
+        response = await self._post("/api/data/languages", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_language(self, language_id: str, **kwargs) -> Dict:
+        """Update a language."""
+        response = await self._put(f"/api/data/languages/{language_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_language(self, language_id: str) -> bool:
+        """Delete a language."""
+        await self._delete(f"/api/data/languages/{language_id}")
+        return True
+
+    async def create_audit_type(self, **kwargs) -> Dict:
+        """Create a new audit type."""
+        response = await self._post("/api/data/audit-types", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_audit_type(self, audit_type_id: str, **kwargs) -> Dict:
+        """Update an audit type."""
+        response = await self._put(f"/api/data/audit-types/{audit_type_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_audit_type(self, audit_type_id: str) -> bool:
+        """Delete an audit type."""
+        await self._delete(f"/api/data/audit-types/{audit_type_id}")
+        return True
+
+    async def create_vulnerability_type(self, **kwargs) -> Dict:
+        """Create a new vulnerability type."""
+        response = await self._post("/api/data/vulnerability-types", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_vulnerability_type(self, vuln_type_id: str, **kwargs) -> Dict:
+        """Update a vulnerability type."""
+        response = await self._put(f"/api/data/vulnerability-types/{vuln_type_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_vulnerability_type(self, vuln_type_id: str) -> bool:
+        """Delete a vulnerability type."""
+        await self._delete(f"/api/data/vulnerability-types/{vuln_type_id}")
+        return True
+
+    async def create_vulnerability_category(self, **kwargs) -> Dict:
+        """Create a new vulnerability category."""
+        response = await self._post("/api/data/vulnerability-categories", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_vulnerability_category(self, category_id: str, **kwargs) -> Dict:
+        """Update a vulnerability category."""
+        response = await self._put(f"/api/data/vulnerability-categories/{category_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_vulnerability_category(self, category_id: str) -> bool:
+        """Delete a vulnerability category."""
+        await self._delete(f"/api/data/vulnerability-categories/{category_id}")
+        return True
+
+    async def create_section(self, **kwargs) -> Dict:
+        """Create a new section definition."""
+        response = await self._post("/api/data/sections", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_section(self, section_id: str, **kwargs) -> Dict:
+        """Update a section definition."""
+        response = await self._put(f"/api/data/sections/{section_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_section(self, section_id: str) -> bool:
+        """Delete a section definition."""
+        await self._delete(f"/api/data/sections/{section_id}")
+        return True
+
+    async def create_custom_field(self, **kwargs) -> Dict:
+        """Create a new custom field definition."""
+        response = await self._post("/api/data/custom-fields", json=kwargs)
+        return response.get("datas", {})
+
+    async def update_custom_field(self, field_id: str, **kwargs) -> Dict:
+        """Update a custom field definition."""
+        response = await self._put(f"/api/data/custom-fields/{field_id}", json=kwargs)
+        return response.get("datas", {})
+
+    async def delete_custom_field(self, field_id: str) -> bool:
+        """Delete a custom field definition."""
+        await self._delete(f"/api/data/custom-fields/{field_id}")
+        return True
+
+    # =========================================================================
+    # IMAGE ENDPOINTS
+    # =========================================================================
+
+    async def get_image(self, image_id: str) -> Dict:
+        """Get image metadata."""
+        response = await self._get(f"/api/images/{image_id}")
+        return response.get("datas", {})
+
+    async def download_image(self, image_id: str) -> bytes:
+        """Download an image file."""
+        await self._ensure_authenticated()
+        response = await self._client.get(
+            f"/api/images/download/{image_id}",
+            headers=self._get_headers(),
+        )
+        return response.content
+
+    async def upload_image(self, audit_id: str, name: str, value: str) -> Dict:
+        """Upload an image."""
+        response = await self._post(
+            "/api/images", json={"auditId": audit_id, "name": name, "value": value}
+        )
+        return response.get("datas", {})
+
+    async def delete_image(self, image_id: str) -> bool:
+        """Delete an image."""
+        await self._delete(f"/api/images/{image_id}")
+        return True
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    async def get_statistics(self) -> Dict:
+        """Get comprehensive statistics."""
+        # Aggregate statistics from multiple endpoints
+        stats = {
+            "audits": len(await self.list_audits()),
+            "clients": len(await self.list_clients()),
+            "companies": len(await self.list_companies()),
+            "vulnerability_templates": len(await self.list_vulnerabilities()),
+            "users": len(await self.list_users()),
+        }
+        return stats
+
+    async def search_findings(
+        self,
+        title: Optional[str] = None,
+        category: Optional[str] = None,
+        severity: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Dict]:
+        """Search findings across all audits."""
+        results = []
+        audits = await self.list_audits()
+
+        for audit in audits:
+            findings = await self.get_findings(audit["_id"])
+            for finding in findings:
+                match = True
+
+                if title and title.lower() not in finding.get("title", "").lower():
+                    match = False
+                if category and category.lower() != finding.get("category", "").lower():
+                    match = False
+                if severity:
+                    # Map CVSS to severity
+                    cvss = finding.get("cvssv3", "")
+                    if severity.lower() == "critical" and not (
+                        cvss and float(cvss.split("/")[0]) >= 9.0
+                    ):
+                        match = False
+                    elif severity.lower() == "high" and not (
+                        cvss and 7.0 <= float(cvss.split("/")[0]) < 9.0
+                    ):
+                        match = False
+
+                if match:
+                    finding["_audit_id"] = audit["_id"]
+                    finding["_audit_name"] = audit.get("name", "")
+                    results.append(finding)
+
+        return results
+
+    async def get_all_findings_with_context(
+        self, include_failed: bool = False, exclude_categories: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        Get all findings with full audit context.
+
+        This comprehensive method extracts:
+        - CWE from customFields
+        - OWASP category
+        - Revalidation status
+        - Strips HTML from descriptions/observations
+        - Includes full audit team (collaborators + creator)
+        - Includes complete scope URLs
+
+        Args:
+            include_failed: Include findings in 'Failed' category
+            exclude_categories: Categories to exclude from results
+
+        Returns:
+            List of findings with enhanced context
+        """
+        import re
+
+        def strip_html(text: str) -> str:
+            """Strip HTML tags from text."""
+            if not text:
+                return ""
+            # Remove HTML tags
+            clean = re.sub(r"<[^>]+>", "", text)
+            # Decode common HTML entities
+            clean = clean.replace("&nbsp;", " ")
+            clean = clean.replace("&lt;", "<")
+            clean = clean.replace("&gt;", ">")
+            clean = clean.replace("&amp;", "&")
+            clean = clean.replace("&quot;", '"')
+            return clean.strip()
+
+        def extract_cwe(custom_fields: List[Dict]) -> Optional[str]:
+            """Extract CWE from customFields."""
+            if not custom_fields:
+                return None
+            for field in custom_fields:
+                if field.get("label", "").lower() in ["cwe", "cwe-id", "cwe id"]:
+                    return field.get("text") or field.get("value")
+            return None
+
+        def extract_owasp(finding: Dict) -> Optional[str]:
+            """Extract OWASP category from finding."""
+            # Check category field
+            category = finding.get("category", "")
+            if "owasp" in category.lower():
+                return category
+
+            # Check customFields for OWASP
+            custom_fields = finding.get("customFields", [])
+            for field in custom_fields:
+                if "owasp" in field.get("label", "").lower():
+                    return field.get("text") or field.get("value")
+
+            return None
+
+        exclude_categories = exclude_categories or []
+        if not include_failed:
+            exclude_categories.append("Failed")
+
+        results = []
+        audits = await self.list_audits()
+
+        for audit in audits:
+            audit_detail = await self.get_audit(audit["_id"])
+            findings = await self.get_findings(audit["_id"])
+
+            for finding in findings:
+                # Filter by category
+                if finding.get("category") in exclude_categories:
+                    continue
+
+                # Extract enhanced metadata
+                cwe = extract_cwe(finding.get("customFields", []))
+                owasp = extract_owasp(finding)
+
+                # Build full team (creator + collaborators)
+                team = []
+                creator = audit_detail.get("creator")
+                if creator:
+                    team.append({"username": creator.get("username"), "role": "creator"})
+
+                collaborators = audit_detail.get("collaborators", [])
+                for collab in collaborators:
+                    team.append({"username": collab.get("username"), "role": "collaborator"})
+
+                # Extract scope URLs
+                scope_urls = []
+                for scope_item in audit_detail.get("scope", []):
+                    if isinstance(scope_item, dict):
+                        scope_urls.append(scope_item.get("name", ""))
+                    else:
+                        scope_urls.append(str(scope_item))
+
+                # Strip HTML from text fields
+                description = strip_html(finding.get("description", ""))
+                observation = strip_html(finding.get("observation", ""))
+                remediation = strip_html(finding.get("remediation", ""))
+
+                # Enhanced finding object
+                enhanced_finding = {
+                    # Original finding fields
+                    "_id": finding.get("_id"),
+                    "title": finding.get("title"),
+                    "category": finding.get("category"),
+                    "severity": finding.get("severity"),
+                    "cvssv3": finding.get("cvssv3"),
+                    "priority": finding.get("priority"),
+                    "status": finding.get("status"),
+                    # Cleaned text fields
+                    "description": description,
+                    "observation": observation,
+                    "remediation": remediation,
+                    # Extracted metadata
+                    "cwe": cwe,
+                    "owasp": owasp,
+                    "revalidation": finding.get("revalidation"),
+                    "references": finding.get("references", []),
+                    "customFields": finding.get("customFields", []),
+                    # Enhanced audit context
+                    "audit": {
+                        "_id": audit["_id"],
+                        "name": audit.get("name"),
+                        "company": audit_detail.get("company", {}).get("name"),
+                        "client": audit_detail.get("client", {}).get("email"),
+                        "date_start": audit_detail.get("date_start"),
+                        "date_end": audit_detail.get("date_end"),
+                        "scope": scope_urls,
+                        "team": team,
+                        "language": audit_detail.get("language"),
+                        "audit_type": audit_detail.get("auditType"),
+                    },
+                }
+
+                results.append(enhanced_finding)
+
+        return results
@@ -18,6 +18,7 @@ Environment Variables:
     PWNDOC_LOG_FILE     - Path to log file (optional)
 """
 
+import functools
 import json
 import logging
 import os
@@ -63,6 +64,7 @@ class Config:
     mcp_transport: str = "stdio"  # stdio, sse, websocket
     mcp_host: str = "127.0.0.1"
     mcp_port: int = 8080
+    tool_timeout: int = 60  # seconds; upper bound for a single tool call
 
     # Feature flags
     enable_caching: bool = True
@@ -153,22 +155,9 @@ class Config:
         Returns:
             List of error messages, empty if valid
         """
-        errors = []
-
-        if not self.url:
-            errors.append("PWNDOC_URL is required")
-        elif not self.url.startswith(("http://", "https://")):
-            errors.append(f"Invalid URL format: {self.url}")
-
-        if not self.token and not (self.username and self.password):
-            errors.append(
-                "Authentication required: provide either PWNDOC_TOKEN or PWNDOC_USERNAME/PWNDOC_PASSWORD"
-            )
-
-        if self.timeout < 1:
-            errors.append(f"Timeout must be positive: {self.timeout}")
-
-        return errors
+        return list(
+            _validation_errors(self.url, self.username, self.password, self.token, self.timeout)
+        )
 
     def is_valid(self) -> bool:
         """Check if configuration is valid.
@@ -189,6 +178,34 @@ class Config:
         return cls(**env_config)
 
 
+@functools.lru_cache(maxsize=32)
+def _validation_errors(url: str, username: str, password: str, token: str, timeout: int) -> tuple:
+    """Compute validation errors for the given config fields.
+
+    Memoized on the field values so repeated validation of the same config
+    (server startup, per-command CLI checks) is a cache hit.
+
+    Returns:
+        Tuple of error messages, empty if valid
+    """
+    errors = []
+
+    if not url:
+        errors.append("PWNDOC_URL is required")
+    elif not url.startswith(("http://", "https://")):
+        errors.append(f"Invalid URL format: {url}")
+
+    if not token and not (username and password):
+        errors.append(
+            "Authentication required: provide either PWNDOC_TOKEN or PWNDOC_USERNAME/PWNDOC_PASSWORD"
+        )
+
+    if timeout < 1:
+        errors.append(f"Timeout must be positive: {timeout}")
+
+    return tuple(errors)
+
+
 def _load_from_env() -> Dict[str, Any]:
     """Load configuration from environment variables."""
     env_mapping = {
@@ -204,6 +221,7 @@ def _load_from_env() -> Dict[str, Any]:
         "PWNDOC_MCP_TRANSPORT": ("mcp_transport", str),
         "PWNDOC_MCP_HOST": ("mcp_host", str),
         "PWNDOC_MCP_PORT": ("mcp_port", int),
+        "PWNDOC_TOOL_TIMEOUT": ("tool_timeout", int),
         "PWNDOC_ENABLE_CACHING": ("enable_caching", lambda x: x.lower() in ("true", "1", "yes")),
         "PWNDOC_CACHE_TTL": ("cache_ttl", int),
     }
@@ -356,9 +374,19 @@ def get_config_path() -> str:
     Returns:
         Path to configuration file as string
     """
-    config_path_env = os.getenv("PWNDOC_CONFIG_FILE")
-    if config_path_env:
-        return str(Path(config_path_env).expanduser())
+    return _resolve_config_path(os.getenv("PWNDOC_CONFIG_FILE"))
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_config_path(env_value: Optional[str]) -> str:
+    """Resolve and cache the config path for a given env override.
+
+    Keyed on the PWNDOC_CONFIG_FILE value so the cache stays correct when
+    the environment changes; Path construction and expanduser() are skipped
+    on repeat lookups.
+    """
+    if env_value:
+        return str(Path(env_value).expanduser())
     return str(DEFAULT_CONFIG_FILE)
 
 
@@ -9,11 +9,13 @@ This module provides comprehensive logging setup with support for:
 - Performance metrics logging
 
 Environment Variables:
-    PWNDOC_LOG_LEVEL    - Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    PWNDOC_LOG_FILE     - Path to log file
-    PWNDOC_LOG_FORMAT   - Log format (text, json)
-    PWNDOC_LOG_MAX_SIZE - Max log file size in MB (default: 10)
-    PWNDOC_LOG_BACKUPS  - Number of backup files to keep (default: 5)
+    PWNDOC_LOG_LEVEL          - Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    PWNDOC_LOG_FILE           - Path to log file
+    PWNDOC_LOG_FORMAT         - Log format (text, json)
+    PWNDOC_LOG_MAX_SIZE       - Max log file size in MB (default: 10)
+    PWNDOC_LOG_BACKUPS        - Number of backup files to keep (default: 5)
+    PWNDOC_LOG_BUFFER         - Records buffered before a file flush (default: 512)
+    PWNDOC_LOG_FLUSH_INTERVAL - Seconds between periodic file flushes (default: 5)
 
 Log Levels:
     DEBUG    - Detailed information for debugging
@@ -27,11 +29,17 @@ Example:
     >>> setup_logging(level="DEBUG", log_file="/var/log/pwndoc-mcp.log")
 """
 
+import atexit
+import functools
+import itertools
 import json
 import logging
 import logging.handlers
 import os
+import socket
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -77,8 +85,18 @@ class ColoredFormatter(logging.Formatter):
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Constant for the life of the process; resolving them per record
+        # would pay a gethostname/getpid call on every emit
+        self._static_fields = {
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+        }
+
     def format(self, record) -> str:
         log_obj = {
+            **self._static_fields,
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
@@ -132,6 +150,139 @@ class SafeStreamHandler(logging.StreamHandler):
                 self.handleError(record)
 
 
+# Single worker keeps backup-chain renames ordered; created lazily so
+# importing this module never spawns a thread
+_rotate_exec: Optional[ThreadPoolExecutor] = None
+
+
+def _rotate_executor() -> ThreadPoolExecutor:
+    global _rotate_exec
+    if _rotate_exec is None:
+        _rotate_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotate")
+        atexit.register(_rotate_exec.shutdown)
+    return _rotate_exec
+
+
+# Distinguishes the pending files of back-to-back rollovers
+_rotate_seq = itertools.count()
+
+
+def _rotate_backups(base_filename: str, backup_count: int, pending: str) -> None:
+    """Shuffle the rotated-backup chain (runs on the rotation worker thread)."""
+    try:
+        if backup_count > 0:
+            for i in range(backup_count - 1, 0, -1):
+                sfn = f"{base_filename}.{i}"
+                dfn = f"{base_filename}.{i + 1}"
+                if os.path.exists(sfn):
+                    os.replace(sfn, dfn)
+            os.replace(pending, f"{base_filename}.1")
+        else:
+            os.remove(pending)
+    except OSError:
+        # Emitting a log record about a failed log rotation would recurse;
+        # losing one backup file is the lesser evil
+        pass
+
+
+class _FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that sizes rollover without re-formatting the record.
+
+    The stdlib implementation formats every record a second time inside
+    ``shouldRollover`` just to measure its length, doubling formatter CPU per
+    emit. Checking the current file position instead trades exact-size limits
+    (files may exceed ``maxBytes`` by one record) for a single format pass.
+
+    Rollover itself only pays for one same-directory rename on the emitting
+    thread; the backup-chain shuffle runs on a background worker so writers
+    are never blocked behind a slow disk.
+    """
+
+    def _open(self):
+        # setup_logging already created the parent directory, so create+append
+        # in one open syscall; close-on-exec keeps the fd out of child
+        # processes, and the 64 KiB buffer batches writes during buffer drains
+        fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+            0o644,
+        )
+        stream = os.fdopen(fd, "a", buffering=1 << 16, encoding=self.encoding, errors=self.errors)
+        # Position at EOF so shouldRollover sees the true size of a pre-existing file
+        stream.seek(0, os.SEEK_END)
+        return stream
+
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return 0 < self.maxBytes <= self.stream.tell()
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        # Unique pending name per rollover so a rapid second rollover cannot
+        # clobber a file the worker has not shuffled into the chain yet; the
+        # single-worker executor processes them in submission order
+        pending = f"{self.baseFilename}.rotating.{next(_rotate_seq)}"
+        os.replace(self.baseFilename, pending)
+        _rotate_executor().submit(_rotate_backups, self.baseFilename, self.backupCount, pending)
+        if not self.delay:
+            self.stream = self._open()
+
+
+class PeriodicFlushMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that drains to its target on a wall-clock interval.
+
+    Records are buffered in memory and written to the wrapped file handler
+    when the buffer fills, when a WARNING-or-above record arrives, on close,
+    and every ``flush_interval`` seconds via a daemon timer. This keeps
+    DEBUG/INFO chatter from paying a syscall per record while bounding how
+    stale the file can get.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = 512,
+        flush_interval: float = 5.0,
+    ):
+        super().__init__(
+            capacity,
+            flushLevel=logging.WARNING,
+            target=target,
+            flushOnClose=True,
+        )
+        self._flush_interval = flush_interval
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        timer = threading.Timer(self._flush_interval, self._periodic_flush)
+        timer.daemon = True
+        timer.start()
+        self._timer = timer
+
+    def _periodic_flush(self):
+        self.flush()
+        self._schedule_flush()
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        atexit.unregister(self.flush)
+        # MemoryHandler.close flushes the buffer but leaves the target open;
+        # close it too so file descriptors are released when handlers are reset
+        target = self.target
+        try:
+            super().close()
+        finally:
+            if target is not None:
+                target.close()
+
+
 class PerformanceLogger:
     """Logger for performance metrics."""
 
@@ -194,14 +345,11 @@ def setup_logging(
         >>> logger = setup_logging(level="DEBUG", log_file="app.log")
         >>> logger.info("Application started")
     """
-    # Check environment variables for overrides
-    env_level = os.environ.get("PWNDOC_LOG_LEVEL")
-    if env_level:
-        level = env_level
-
-    env_file = os.environ.get("PWNDOC_LOG_FILE")
-    if env_file:
-        log_file = env_file
+    # Check environment variables for overrides; bind the mapping once so
+    # every override below is a plain local dict lookup
+    env = os.environ
+    level = env.get("PWNDOC_LOG_LEVEL") or level
+    log_file = env.get("PWNDOC_LOG_FILE") or log_file
 
     # Get logger (root or named)
     if name:
@@ -252,7 +400,7 @@ def setup_logging(
             max_bytes = max_size_mb * 1024 * 1024
 
         # Use rotating file handler with UTF-8 encoding
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _FastRotatingFileHandler(
             log_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -265,7 +413,13 @@ def setup_logging(
         else:
             file_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
 
-        root_logger.addHandler(file_handler)
+        # Buffer file writes in memory; WARNING and above still flush immediately
+        memory_handler = PeriodicFlushMemoryHandler(
+            file_handler,
+            capacity=int(env.get("PWNDOC_LOG_BUFFER", "512")),
+            flush_interval=float(env.get("PWNDOC_LOG_FLUSH_INTERVAL", "5")),
+        )
+        root_logger.addHandler(memory_handler)
 
     # Configure library loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -274,10 +428,16 @@ def setup_logging(
     return root_logger
 
 
+@functools.lru_cache(maxsize=512)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger for a specific module.
 
+    Results are cached: ``logging.getLogger`` already interns loggers but
+    takes the logging module's global lock on every call, so repeat lookups
+    hit the lock-free lru_cache instead. Tests that need a clean slate can
+    call ``get_logger.cache_clear()``.
+
     Args:
         name: Logger name (typically __name__), if None returns root logger
 
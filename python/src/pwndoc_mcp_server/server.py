@@ -13,6 +13,7 @@ Supports multiple transports:
 import asyncio
 import json
 import logging
+import signal
 import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional, Union
@@ -23,6 +24,38 @@ from .version import get_version
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize to JSON bytes (orjson fast path)."""
+        return orjson.dumps(obj, default=str)
+
+    def _dumps_indented(obj: Any) -> str:
+        """Pretty-print to a JSON string (orjson fast path)."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, default=str).encode()
+
+    def _dumps_indented(obj: Any) -> str:
+        """Pretty-print to a JSON string (stdlib fallback)."""
+        return json.dumps(obj, indent=2, default=str)
+
+
+@dataclass
+class PreEncoded:
+    """Result payload already serialized to JSON bytes.
+
+    Transport writers splice ``data`` directly into the JSON-RPC envelope
+    instead of re-serializing the (potentially large) payload a second time.
+    """
+
+    data: bytes
+
 
 @dataclass
 class Tool:
@@ -63,6 +96,10 @@ class PwnDocMCPServer:
     SERVER_VERSION = get_version()
     PROTOCOL_VERSION = "2024-11-05"
 
+    # Tools with these prefixes are pure reads against PwnDoc and safe to
+    # coalesce when identical calls are in flight concurrently.
+    READ_TOOL_PREFIXES = ("list_", "get_", "search_", "export_")
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -88,10 +125,26 @@ class PwnDocMCPServer:
         self._client: Optional[PwnDocClient] = None
         self._tools: Dict[str, Tool] = {}
         self._initialized = False
+        self._sse_sessions: Dict[str, Any] = {}
+        self._inflight: Dict[Any, "asyncio.Future"] = {}
 
         # Register all tools
         self._register_tools()
 
+        # Tool definitions are immutable after registration; build the
+        # tools/list payload once instead of on every request.
+        self._tools_list: List[Dict] = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.parameters,
+            }
+            for tool in self._tools.values()
+        ]
+        # Serialized lazily on the first tools/list request; every MCP client
+        # sends one on connect and the payload never changes.
+        self._tools_list_encoded: Optional[PreEncoded] = None
+
         # Only log if not silent (prevents stdout pollution during module import)
         if not _silent:
             logger.info(f"PwnDocMCPServer initialized with {len(self._tools)} tools")
@@ -133,7 +186,7 @@ class PwnDocMCPServer:
                     }
                 },
             },
-            handler=self._handle_list_audits,
+            handler=self._client_handler("list_audits"),
         )
 
         self._register_tool(
@@ -161,7 +214,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["name", "language", "audit_type"],
             },
-            handler=self._handle_create_audit,
+            handler=self._client_handler("create_audit"),
         )
 
         self._register_tool(
@@ -184,7 +237,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id"],
             },
-            handler=self._handle_update_audit_general,
+            handler=self._client_handler("update_audit_general"),
         )
 
         self._register_tool(
@@ -197,7 +250,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id"],
             },
-            handler=self._handle_delete_audit,
+            handler=self._wrap_delete("delete_audit", "Audit {audit_id} deleted"),
         )
 
         self._register_tool(
@@ -219,7 +272,7 @@ class PwnDocMCPServer:
                 "properties": {"audit_id": {"type": "string", "description": "The audit ID"}},
                 "required": ["audit_id"],
             },
-            handler=self._handle_get_audit_general,
+            handler=self._client_handler("get_audit_general"),
         )
 
         self._register_tool(
@@ -230,7 +283,7 @@ class PwnDocMCPServer:
                 "properties": {"audit_id": {"type": "string", "description": "The audit ID"}},
                 "required": ["audit_id"],
             },
-            handler=self._handle_get_audit_network,
+            handler=self._client_handler("get_audit_network"),
         )
 
         self._register_tool(
@@ -244,7 +297,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "network_data"],
             },
-            handler=self._handle_update_audit_network,
+            handler=self._client_handler("update_audit_network"),
         )
 
         self._register_tool(
@@ -255,7 +308,7 @@ class PwnDocMCPServer:
                 "properties": {"audit_id": {"type": "string", "description": "The audit ID"}},
                 "required": ["audit_id"],
             },
-            handler=self._handle_toggle_audit_approval,
+            handler=self._client_handler("toggle_audit_approval"),
         )
 
         self._register_tool(
@@ -269,7 +322,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "state"],
             },
-            handler=self._handle_update_review_status,
+            handler=self._client_handler("update_review_status"),
         )
 
         self._register_tool(
@@ -280,7 +333,7 @@ class PwnDocMCPServer:
                 "properties": {"audit_id": {"type": "string", "description": "The audit ID"}},
                 "required": ["audit_id"],
             },
-            handler=self._handle_get_audit_sections,
+            handler=self._client_handler("get_audit_sections"),
         )
 
         self._register_tool(
@@ -294,7 +347,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "sections"],
             },
-            handler=self._handle_update_audit_sections,
+            handler=self._client_handler("update_audit_sections"),
         )
 
         # =====================================================================
@@ -309,7 +362,7 @@ class PwnDocMCPServer:
                 "properties": {"audit_id": {"type": "string", "description": "The audit ID"}},
                 "required": ["audit_id"],
             },
-            handler=self._handle_get_findings,
+            handler=self._client_handler("get_findings"),
         )
 
         self._register_tool(
@@ -323,7 +376,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_id"],
             },
-            handler=self._handle_get_finding,
+            handler=self._client_handler("get_finding"),
         )
 
         self._register_tool(
@@ -351,7 +404,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "title"],
             },
-            handler=self._handle_create_finding,
+            handler=self._client_handler("create_finding"),
         )
 
         self._register_tool(
@@ -376,7 +429,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_id"],
             },
-            handler=self._handle_update_finding,
+            handler=self._client_handler("update_finding"),
         )
 
         self._register_tool(
@@ -390,7 +443,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_id"],
             },
-            handler=self._handle_delete_finding,
+            handler=self._wrap_delete("delete_finding", "Finding {finding_id} deleted"),
         )
 
         self._register_tool(
@@ -408,7 +461,7 @@ class PwnDocMCPServer:
                     "status": {"type": "string", "description": "Filter by status"},
                 },
             },
-            handler=self._handle_search_findings,
+            handler=self._client_handler("search_findings"),
         )
 
         self._register_tool(
@@ -428,7 +481,7 @@ class PwnDocMCPServer:
                     },
                 },
             },
-            handler=self._handle_get_all_findings_with_context,
+            handler=self._client_handler("get_all_findings_with_context"),
         )
 
         self._register_tool(
@@ -446,7 +499,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_order"],
             },
-            handler=self._handle_sort_findings,
+            handler=self._client_handler("sort_findings"),
         )
 
         self._register_tool(
@@ -464,7 +517,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_id", "destination_audit_id"],
             },
-            handler=self._handle_move_finding,
+            handler=self._client_handler("move_finding"),
         )
 
         # =====================================================================
@@ -475,7 +528,7 @@ class PwnDocMCPServer:
             name="list_clients",
             description="List all clients.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_clients,
+            handler=self._client_handler("list_clients"),
         )
 
         self._register_tool(
@@ -494,7 +547,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["email", "firstname", "lastname"],
             },
-            handler=self._handle_create_client,
+            handler=self._client_handler("create_client"),
         )
 
         self._register_tool(
@@ -514,7 +567,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["client_id"],
             },
-            handler=self._handle_update_client,
+            handler=self._client_handler("update_client"),
         )
 
         self._register_tool(
@@ -527,14 +580,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["client_id"],
             },
-            handler=self._handle_delete_client,
+            handler=self._wrap_delete("delete_client", "Client {client_id} deleted"),
         )
 
         self._register_tool(
             name="list_companies",
             description="List all companies.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_companies,
+            handler=self._client_handler("list_companies"),
         )
 
         self._register_tool(
@@ -549,7 +602,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["name"],
             },
-            handler=self._handle_create_company,
+            handler=self._client_handler("create_company"),
         )
 
         self._register_tool(
@@ -565,7 +618,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["company_id"],
             },
-            handler=self._handle_update_company,
+            handler=self._client_handler("update_company"),
         )
 
         self._register_tool(
@@ -578,7 +631,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["company_id"],
             },
-            handler=self._handle_delete_company,
+            handler=self._wrap_delete("delete_company", "Company {company_id} deleted"),
         )
 
         # =====================================================================
@@ -589,7 +642,7 @@ class PwnDocMCPServer:
             name="list_vulnerabilities",
             description="List all vulnerability templates in the library.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_vulnerabilities,
+            handler=self._client_handler("list_vulnerabilities"),
         )
 
         self._register_tool(
@@ -605,7 +658,7 @@ class PwnDocMCPServer:
                     }
                 },
             },
-            handler=self._handle_get_vulnerabilities_by_locale,
+            handler=self._client_handler("get_vulnerabilities_by_locale"),
         )
 
         self._register_tool(
@@ -625,7 +678,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["details"],
             },
-            handler=self._handle_create_vulnerability,
+            handler=self._client_handler("create_vulnerability"),
         )
 
         self._register_tool(
@@ -646,7 +699,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["vuln_id"],
             },
-            handler=self._handle_update_vulnerability,
+            handler=self._client_handler("update_vulnerability"),
         )
 
         self._register_tool(
@@ -662,7 +715,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["vuln_id"],
             },
-            handler=self._handle_delete_vulnerability,
+            handler=self._wrap_delete("delete_vulnerability", "Vulnerability {vuln_id} deleted"),
         )
 
         self._register_tool(
@@ -686,7 +739,7 @@ class PwnDocMCPServer:
             name="export_vulnerabilities",
             description="Export all vulnerability templates.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_export_vulnerabilities,
+            handler=self._client_handler("export_vulnerabilities"),
         )
 
         self._register_tool(
@@ -701,14 +754,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "finding_id"],
             },
-            handler=self._handle_create_vulnerability_from_finding,
+            handler=self._client_handler("create_vulnerability_from_finding"),
         )
 
         self._register_tool(
             name="get_vulnerability_updates",
             description="Get available vulnerability template updates.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_vulnerability_updates,
+            handler=self._client_handler("get_vulnerability_updates"),
         )
 
         self._register_tool(
@@ -722,7 +775,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["vuln_id", "update_id"],
             },
-            handler=self._handle_merge_vulnerability,
+            handler=self._client_handler("merge_vulnerability"),
         )
 
         # =====================================================================
@@ -733,14 +786,14 @@ class PwnDocMCPServer:
             name="list_users",
             description="List all users (admin only).",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_users,
+            handler=self._client_handler("list_users"),
         )
 
         self._register_tool(
             name="get_current_user",
             description="Get current authenticated user's info.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_current_user,
+            handler=self._client_handler("get_current_user"),
         )
 
         self._register_tool(
@@ -751,7 +804,7 @@ class PwnDocMCPServer:
                 "properties": {"username": {"type": "string", "description": "Username"}},
                 "required": ["username"],
             },
-            handler=self._handle_get_user,
+            handler=self._client_handler("get_user"),
         )
 
         self._register_tool(
@@ -769,7 +822,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["username", "password", "firstname", "lastname", "email", "role"],
             },
-            handler=self._handle_create_user,
+            handler=self._client_handler("create_user"),
         )
 
         self._register_tool(
@@ -787,7 +840,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["user_id"],
             },
-            handler=self._handle_update_user,
+            handler=self._client_handler("update_user"),
         )
 
         self._register_tool(
@@ -802,28 +855,28 @@ class PwnDocMCPServer:
                     "password": {"type": "string", "description": "New password"},
                 },
             },
-            handler=self._handle_update_current_user,
+            handler=self._client_handler("update_current_user"),
         )
 
         self._register_tool(
             name="list_reviewers",
             description="List all users with reviewer role.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_reviewers,
+            handler=self._client_handler("list_reviewers"),
         )
 
         self._register_tool(
             name="get_totp_status",
             description="Get TOTP (2FA) status for current user.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_totp,
+            handler=self._client_handler("get_totp"),
         )
 
         self._register_tool(
             name="setup_totp",
             description="Setup TOTP (2FA) for current user.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_setup_totp,
+            handler=self._client_handler("setup_totp"),
         )
 
         self._register_tool(
@@ -836,7 +889,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["token"],
             },
-            handler=self._handle_disable_totp,
+            handler=self._client_handler("disable_totp"),
         )
 
         # =====================================================================
@@ -847,7 +900,7 @@ class PwnDocMCPServer:
             name="list_templates",
             description="List all report templates.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_templates,
+            handler=self._client_handler("list_templates"),
         )
 
         self._register_tool(
@@ -865,7 +918,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["name", "ext", "file_content"],
             },
-            handler=self._handle_create_template,
+            handler=self._client_handler("create_template"),
         )
 
         self._register_tool(
@@ -884,7 +937,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["template_id"],
             },
-            handler=self._handle_update_template,
+            handler=self._client_handler("update_template"),
         )
 
         self._register_tool(
@@ -897,7 +950,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["template_id"],
             },
-            handler=self._handle_delete_template,
+            handler=self._wrap_delete("delete_template", "Template {template_id} deleted"),
         )
 
         self._register_tool(
@@ -917,14 +970,14 @@ class PwnDocMCPServer:
             name="get_settings",
             description="Get system settings.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_settings,
+            handler=self._client_handler("get_settings"),
         )
 
         self._register_tool(
             name="get_public_settings",
             description="Get public settings (no authentication required).",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_public_settings,
+            handler=self._client_handler("get_public_settings"),
         )
 
         self._register_tool(
@@ -935,14 +988,14 @@ class PwnDocMCPServer:
                 "properties": {"settings": {"type": "object", "description": "Settings to update"}},
                 "required": ["settings"],
             },
-            handler=self._handle_update_settings,
+            handler=self._client_handler("update_settings"),
         )
 
         self._register_tool(
             name="export_settings",
             description="Export all system settings.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_export_settings,
+            handler=self._client_handler("export_settings"),
         )
 
         self._register_tool(
@@ -953,14 +1006,14 @@ class PwnDocMCPServer:
                 "properties": {"settings": {"type": "object", "description": "Settings to import"}},
                 "required": ["settings"],
             },
-            handler=self._handle_import_settings,
+            handler=self._client_handler("import_settings"),
         )
 
         self._register_tool(
             name="list_languages",
             description="List all configured languages.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_languages,
+            handler=self._client_handler("list_languages"),
         )
 
         self._register_tool(
@@ -974,7 +1027,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["language", "name"],
             },
-            handler=self._handle_create_language,
+            handler=self._client_handler("create_language"),
         )
 
         self._register_tool(
@@ -989,7 +1042,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["language_id"],
             },
-            handler=self._handle_update_language,
+            handler=self._client_handler("update_language"),
         )
 
         self._register_tool(
@@ -1002,14 +1055,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["language_id"],
             },
-            handler=self._handle_delete_language,
+            handler=self._wrap_delete("delete_language", "Language {language_id} deleted"),
         )
 
         self._register_tool(
             name="list_audit_types",
             description="List all audit types.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_audit_types,
+            handler=self._client_handler("list_audit_types"),
         )
 
         self._register_tool(
@@ -1027,7 +1080,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["name"],
             },
-            handler=self._handle_create_audit_type,
+            handler=self._client_handler("create_audit_type"),
         )
 
         self._register_tool(
@@ -1042,7 +1095,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_type_id"],
             },
-            handler=self._handle_update_audit_type,
+            handler=self._client_handler("update_audit_type"),
         )
 
         self._register_tool(
@@ -1055,14 +1108,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_type_id"],
             },
-            handler=self._handle_delete_audit_type,
+            handler=self._wrap_delete("delete_audit_type", "Audit type {audit_type_id} deleted"),
         )
 
         self._register_tool(
             name="list_vulnerability_types",
             description="List all vulnerability types.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_vulnerability_types,
+            handler=self._client_handler("list_vulnerability_types"),
         )
 
         self._register_tool(
@@ -1075,7 +1128,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["name"],
             },
-            handler=self._handle_create_vulnerability_type,
+            handler=self._client_handler("create_vulnerability_type"),
         )
 
         self._register_tool(
@@ -1089,7 +1142,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["vuln_type_id"],
             },
-            handler=self._handle_update_vulnerability_type,
+            handler=self._client_handler("update_vulnerability_type"),
         )
 
         self._register_tool(
@@ -1105,14 +1158,16 @@ class PwnDocMCPServer:
                 },
                 "required": ["vuln_type_id"],
             },
-            handler=self._handle_delete_vulnerability_type,
+            handler=self._wrap_delete(
+                "delete_vulnerability_type", "Vulnerability type {vuln_type_id} deleted"
+            ),
         )
 
         self._register_tool(
             name="list_vulnerability_categories",
             description="List all vulnerability categories.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_vulnerability_categories,
+            handler=self._client_handler("list_vulnerability_categories"),
         )
 
         self._register_tool(
@@ -1123,7 +1178,7 @@ class PwnDocMCPServer:
                 "properties": {"name": {"type": "string", "description": "Category name"}},
                 "required": ["name"],
             },
-            handler=self._handle_create_vulnerability_category,
+            handler=self._client_handler("create_vulnerability_category"),
         )
 
         self._register_tool(
@@ -1137,7 +1192,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["category_id"],
             },
-            handler=self._handle_update_vulnerability_category,
+            handler=self._client_handler("update_vulnerability_category"),
         )
 
         self._register_tool(
@@ -1150,14 +1205,16 @@ class PwnDocMCPServer:
                 },
                 "required": ["category_id"],
             },
-            handler=self._handle_delete_vulnerability_category,
+            handler=self._wrap_delete(
+                "delete_vulnerability_category", "Vulnerability category {category_id} deleted"
+            ),
         )
 
         self._register_tool(
             name="list_sections",
             description="List all section definitions.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_sections,
+            handler=self._client_handler("list_sections"),
         )
 
         self._register_tool(
@@ -1171,7 +1228,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["field", "name"],
             },
-            handler=self._handle_create_section,
+            handler=self._client_handler("create_section"),
         )
 
         self._register_tool(
@@ -1186,7 +1243,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["section_id"],
             },
-            handler=self._handle_update_section,
+            handler=self._client_handler("update_section"),
         )
 
         self._register_tool(
@@ -1199,14 +1256,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["section_id"],
             },
-            handler=self._handle_delete_section,
+            handler=self._wrap_delete("delete_section", "Section {section_id} deleted"),
         )
 
         self._register_tool(
             name="list_custom_fields",
             description="List all custom field definitions.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_custom_fields,
+            handler=self._client_handler("list_custom_fields"),
         )
 
         self._register_tool(
@@ -1223,7 +1280,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["label", "field_type"],
             },
-            handler=self._handle_create_custom_field,
+            handler=self._client_handler("create_custom_field"),
         )
 
         self._register_tool(
@@ -1238,7 +1295,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["field_id"],
             },
-            handler=self._handle_update_custom_field,
+            handler=self._client_handler("update_custom_field"),
         )
 
         self._register_tool(
@@ -1251,14 +1308,14 @@ class PwnDocMCPServer:
                 },
                 "required": ["field_id"],
             },
-            handler=self._handle_delete_custom_field,
+            handler=self._wrap_delete("delete_custom_field", "Custom field {field_id} deleted"),
         )
 
         self._register_tool(
             name="list_roles",
             description="List all user roles.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_list_roles,
+            handler=self._client_handler("list_roles"),
         )
 
         # =====================================================================
@@ -1273,7 +1330,7 @@ class PwnDocMCPServer:
                 "properties": {"image_id": {"type": "string", "description": "Image ID"}},
                 "required": ["image_id"],
             },
-            handler=self._handle_get_image,
+            handler=self._client_handler("get_image"),
         )
 
         self._register_tool(
@@ -1301,7 +1358,7 @@ class PwnDocMCPServer:
                 },
                 "required": ["audit_id", "name", "value"],
             },
-            handler=self._handle_upload_image,
+            handler=self._client_handler("upload_image"),
         )
 
         self._register_tool(
@@ -1312,7 +1369,7 @@ class PwnDocMCPServer:
                 "properties": {"image_id": {"type": "string", "description": "Image ID to delete"}},
                 "required": ["image_id"],
             },
-            handler=self._handle_delete_image,
+            handler=self._wrap_delete("delete_image", "Image {image_id} deleted"),
         )
 
         # =====================================================================
@@ -1323,7 +1380,7 @@ class PwnDocMCPServer:
             name="get_statistics",
             description="Get comprehensive statistics about audits, findings, clients, and more.",
             parameters={"type": "object", "properties": {}},
-            handler=self._handle_get_statistics,
+            handler=self._client_handler("get_statistics"),
         )
 
     def _register_tool(
@@ -1347,316 +1404,58 @@ class PwnDocMCPServer:
     # TOOL HANDLERS
     # =========================================================================
 
-    def _handle_list_audits(self, finding_title: Optional[str] = None) -> List[Dict]:
-        return self.client.list_audits(finding_title)
-
-    def _handle_get_audit(self, audit_id: str) -> Dict:
-        return self.client.get_audit(audit_id)
-
-    def _handle_create_audit(self, name: str, language: str, audit_type: str) -> Dict:
-        return self.client.create_audit(name, language, audit_type)
-
-    def _handle_update_audit_general(self, audit_id: str, **kwargs) -> Dict:
-        return self.client.update_audit_general(audit_id, **kwargs)
-
-    def _handle_delete_audit(self, audit_id: str) -> Dict:
-        self.client.delete_audit(audit_id)
-        return {"success": True, "message": f"Audit {audit_id} deleted"}
-
-    def _handle_generate_report(self, audit_id: str) -> Dict:
-        content = self.client.generate_report(audit_id)
-        return {"success": True, "size_bytes": len(content)}
-
-    def _handle_get_findings(self, audit_id: str) -> List[Dict]:
-        return self.client.get_findings(audit_id)
-
-    def _handle_get_finding(self, audit_id: str, finding_id: str) -> Dict:
-        return self.client.get_finding(audit_id, finding_id)
-
-    def _handle_create_finding(self, audit_id: str, **kwargs) -> Dict:
-        return self.client.create_finding(audit_id, **kwargs)
-
-    def _handle_update_finding(self, audit_id: str, finding_id: str, **kwargs) -> Dict:
-        return self.client.update_finding(audit_id, finding_id, **kwargs)
-
-    def _handle_delete_finding(self, audit_id: str, finding_id: str) -> Dict:
-        self.client.delete_finding(audit_id, finding_id)
-        return {"success": True, "message": f"Finding {finding_id} deleted"}
-
-    def _handle_search_findings(self, **kwargs) -> List[Dict]:
-        return self.client.search_findings(**kwargs)
-
-    def _handle_get_all_findings_with_context(
-        self, include_failed: bool = False, exclude_categories: Optional[List[str]] = None
-    ) -> List[Dict]:
-        return self.client.get_all_findings_with_context(include_failed, exclude_categories)
-
-    def _handle_list_clients(self) -> List[Dict]:
-        return self.client.list_clients()
-
-    def _handle_create_client(self, **kwargs) -> Dict:
-        return self.client.create_client(**kwargs)
-
-    def _handle_update_client(self, client_id: str, **kwargs) -> Dict:
-        return self.client.update_client(client_id, **kwargs)
-
-    def _handle_delete_client(self, client_id: str) -> Dict:
-        self.client.delete_client(client_id)
-        return {"success": True, "message": f"Client {client_id} deleted"}
-
-    def _handle_list_companies(self) -> List[Dict]:
-        return self.client.list_companies()
-
-    def _handle_create_company(self, **kwargs) -> Dict:
-        return self.client.create_company(**kwargs)
-
-    def _handle_list_vulnerabilities(self) -> List[Dict]:
-        return self.client.list_vulnerabilities()
-
-    def _handle_get_vulnerabilities_by_locale(self, locale: str = "en") -> List[Dict]:
-        return self.client.get_vulnerabilities_by_locale(locale)
-
-    def _handle_create_vulnerability(self, **kwargs) -> Dict:
-        return self.client.create_vulnerability(**kwargs)
-
-    def _handle_list_users(self) -> List[Dict]:
-        return self.client.list_users()
-
-    def _handle_get_current_user(self) -> Dict:
-        return self.client.get_current_user()
-
-    def _handle_list_templates(self) -> List[Dict]:
-        return self.client.list_templates()
-
-    def _handle_list_languages(self) -> List[Dict]:
-        return self.client.list_languages()
-
-    def _handle_list_audit_types(self) -> List[Dict]:
-        return self.client.list_audit_types()
-
-    def _handle_get_statistics(self) -> Dict:
-        return self.client.get_statistics()
-
-    # Audit handlers
-    def _handle_get_audit_general(self, audit_id: str) -> Dict:
-        return self.client.get_audit_general(audit_id)
+    def _client_handler(self, method_name: str) -> Callable:
+        """
+        Build a handler that forwards tool arguments to the named client method.
 
-    def _handle_get_audit_network(self, audit_id: str) -> Dict:
-        return self.client.get_audit_network(audit_id)
+        The client method is looked up on ``self.client`` at call time, not at
+        registration time, so tests (and callers) can still swap or patch
+        client methods after the server is constructed.
+        """
 
-    def _handle_update_audit_network(self, audit_id: str, network_data: Dict) -> Dict:
-        return self.client.update_audit_network(audit_id, network_data)
+        def handler(**kwargs):
+            return getattr(self.client, method_name)(**kwargs)
 
-    def _handle_toggle_audit_approval(self, audit_id: str) -> Dict:
-        return self.client.toggle_audit_approval(audit_id)
+        handler.__name__ = f"_handle_{method_name}"
+        return handler
 
-    def _handle_update_review_status(self, audit_id: str, state: bool) -> Dict:
-        return self.client.update_review_status(audit_id, state)
+    def _wrap_delete(self, method_name: str, message: str) -> Callable:
+        """
+        Build a handler for delete endpoints that returns a success message.
 
-    # Finding handlers
-    def _handle_sort_findings(self, audit_id: str, finding_order: List[str]) -> Dict:
-        return self.client.sort_findings(audit_id, finding_order)
+        Args:
+            method_name: Client method to invoke
+            message: Confirmation template formatted with the tool arguments
+        """
 
-    def _handle_move_finding(
-        self, audit_id: str, finding_id: str, destination_audit_id: str
-    ) -> Dict:
-        return self.client.move_finding(audit_id, finding_id, destination_audit_id)
+        def handler(**kwargs):
+            getattr(self.client, method_name)(**kwargs)
+            return {"success": True, "message": message.format(**kwargs)}
 
-    # Company handlers
-    def _handle_update_company(self, company_id: str, **kwargs) -> Dict:
-        return self.client.update_company(company_id, **kwargs)
+        handler.__name__ = f"_handle_{method_name}"
+        return handler
 
-    def _handle_delete_company(self, company_id: str) -> Dict:
-        self.client.delete_company(company_id)
-        return {"success": True, "message": f"Company {company_id} deleted"}
+    # Handlers that do more than forward to the client keep explicit methods.
 
-    # Vulnerability handlers
-    def _handle_update_vulnerability(self, vuln_id: str, **kwargs) -> Dict:
-        return self.client.update_vulnerability(vuln_id, **kwargs)
+    def _handle_get_audit(self, audit_id: str) -> Dict:
+        return self.client.get_audit(audit_id)
 
-    def _handle_delete_vulnerability(self, vuln_id: str) -> Dict:
-        self.client.delete_vulnerability(vuln_id)
-        return {"success": True, "message": f"Vulnerability {vuln_id} deleted"}
+    def _handle_generate_report(self, audit_id: str) -> Dict:
+        content = self.client.generate_report(audit_id)
+        return {"success": True, "size_bytes": len(content)}
 
     def _handle_bulk_delete_vulnerabilities(self, vuln_ids: List[str]) -> Dict:
         self.client.bulk_delete_vulnerabilities(vuln_ids)
         return {"success": True, "message": f"Deleted {len(vuln_ids)} vulnerabilities"}
 
-    def _handle_export_vulnerabilities(self) -> Dict:
-        return self.client.export_vulnerabilities()
-
-    def _handle_create_vulnerability_from_finding(self, **kwargs) -> Dict:
-        return self.client.create_vulnerability_from_finding(**kwargs)
-
-    # User handlers
-    def _handle_get_user(self, username: str) -> Dict:
-        return self.client.get_user(username)
-
-    def _handle_create_user(self, **kwargs) -> Dict:
-        return self.client.create_user(**kwargs)
-
-    def _handle_update_user(self, user_id: str, **kwargs) -> Dict:
-        return self.client.update_user(user_id, **kwargs)
-
-    def _handle_update_current_user(self, **kwargs) -> Dict:
-        return self.client.update_current_user(**kwargs)
-
-    def _handle_list_reviewers(self) -> List[Dict]:
-        return self.client.list_reviewers()
-
-    # Template handlers
-    def _handle_create_template(self, name: str, ext: str, file_content: str) -> Dict:
-        return self.client.create_template(name, ext, file_content)
-
-    def _handle_update_template(self, template_id: str, **kwargs) -> Dict:
-        return self.client.update_template(template_id, **kwargs)
-
-    def _handle_delete_template(self, template_id: str) -> Dict:
-        self.client.delete_template(template_id)
-        return {"success": True, "message": f"Template {template_id} deleted"}
-
     def _handle_download_template(self, template_id: str) -> Dict:
         content = self.client.download_template(template_id)
         return {"success": True, "size_bytes": len(content)}
 
-    # Settings handlers
-    def _handle_get_settings(self) -> Dict:
-        return self.client.get_settings()
-
-    def _handle_get_public_settings(self) -> Dict:
-        return self.client.get_public_settings()
-
-    def _handle_update_settings(self, settings: Dict) -> Dict:
-        return self.client.update_settings(settings)
-
-    # Data type handlers
-    def _handle_list_vulnerability_types(self) -> List[Dict]:
-        return self.client.list_vulnerability_types()
-
-    def _handle_list_vulnerability_categories(self) -> List[Dict]:
-        return self.client.list_vulnerability_categories()
-
-    def _handle_list_sections(self) -> List[Dict]:
-        return self.client.list_sections()
-
-    def _handle_list_custom_fields(self) -> List[Dict]:
-        return self.client.list_custom_fields()
-
-    def _handle_list_roles(self) -> List[Dict]:
-        return self.client.list_roles()
-
-    # Image handlers
-    def _handle_get_image(self, image_id: str) -> Dict:
-        return self.client.get_image(image_id)
-
     def _handle_download_image(self, image_id: str) -> Dict:
         content = self.client.download_image(image_id)
         return {"success": True, "size_bytes": len(content)}
 
-    def _handle_upload_image(self, audit_id: str, name: str, value: str) -> Dict:
-        return self.client.upload_image(audit_id, name, value)
-
-    def _handle_delete_image(self, image_id: str) -> Dict:
-        self.client.delete_image(image_id)
-        return {"success": True, "message": f"Image {image_id} deleted"}
-
-    # Audit section handlers
-    def _handle_get_audit_sections(self, audit_id: str) -> Dict:
-        return self.client.get_audit_sections(audit_id)
-
-    def _handle_update_audit_sections(self, audit_id: str, sections: Dict) -> Dict:
-        return self.client.update_audit_sections(audit_id, sections)
-
-    # TOTP handlers
-    def _handle_get_totp(self) -> Dict:
-        return self.client.get_totp()
-
-    def _handle_setup_totp(self) -> Dict:
-        return self.client.setup_totp()
-
-    def _handle_disable_totp(self, token: str) -> Dict:
-        return self.client.disable_totp(token)
-
-    # Settings handlers
-    def _handle_export_settings(self) -> Dict:
-        return self.client.export_settings()
-
-    def _handle_import_settings(self, settings: Dict) -> Dict:
-        return self.client.import_settings(settings)
-
-    # Language handlers
-    def _handle_create_language(self, **kwargs) -> Dict:
-        return self.client.create_language(**kwargs)
-
-    def _handle_update_language(self, language_id: str, **kwargs) -> Dict:
-        return self.client.update_language(language_id, **kwargs)
-
-    def _handle_delete_language(self, language_id: str) -> Dict:
-        self.client.delete_language(language_id)
-        return {"success": True, "message": f"Language {language_id} deleted"}
-
-    # Audit type handlers
-    def _handle_create_audit_type(self, **kwargs) -> Dict:
-        return self.client.create_audit_type(**kwargs)
-
-    def _handle_update_audit_type(self, audit_type_id: str, **kwargs) -> Dict:
-        return self.client.update_audit_type(audit_type_id, **kwargs)
-
-    def _handle_delete_audit_type(self, audit_type_id: str) -> Dict:
-        self.client.delete_audit_type(audit_type_id)
-        return {"success": True, "message": f"Audit type {audit_type_id} deleted"}
-
-    # Vulnerability type handlers
-    def _handle_create_vulnerability_type(self, **kwargs) -> Dict:
-        return self.client.create_vulnerability_type(**kwargs)
-
-    def _handle_update_vulnerability_type(self, vuln_type_id: str, **kwargs) -> Dict:
-        return self.client.update_vulnerability_type(vuln_type_id, **kwargs)
-
-    def _handle_delete_vulnerability_type(self, vuln_type_id: str) -> Dict:
-        self.client.delete_vulnerability_type(vuln_type_id)
-        return {"success": True, "message": f"Vulnerability type {vuln_type_id} deleted"}
-
-    # Vulnerability category handlers
-    def _handle_create_vulnerability_category(self, **kwargs) -> Dict:
-        return self.client.create_vulnerability_category(**kwargs)
-
-    def _handle_update_vulnerability_category(self, category_id: str, **kwargs) -> Dict:
-        return self.client.update_vulnerability_category(category_id, **kwargs)
-
-    def _handle_delete_vulnerability_category(self, category_id: str) -> Dict:
-        self.client.delete_vulnerability_category(category_id)
-        return {"success": True, "message": f"Vulnerability category {category_id} deleted"}
-
-    # Section handlers
-    def _handle_create_section(self, **kwargs) -> Dict:
-        return self.client.create_section(**kwargs)
-
-    def _handle_update_section(self, section_id: str, **kwargs) -> Dict:
-        return self.client.update_section(section_id, **kwargs)
-
-    def _handle_delete_section(self, section_id: str) -> Dict:
-        self.client.delete_section(section_id)
-        return {"success": True, "message": f"Section {section_id} deleted"}
-
-    # Custom field handlers
-    def _handle_create_custom_field(self, **kwargs) -> Dict:
-        return self.client.create_custom_field(**kwargs)
-
-    def _handle_update_custom_field(self, field_id: str, **kwargs) -> Dict:
-        return self.client.update_custom_field(field_id, **kwargs)
-
-    def _handle_delete_custom_field(self, field_id: str) -> Dict:
-        self.client.delete_custom_field(field_id)
-        return {"success": True, "message": f"Custom field {field_id} deleted"}
-
-    # Vulnerability update handlers
-    def _handle_get_vulnerability_updates(self) -> List[Dict]:
-        return self.client.get_vulnerability_updates()
-
-    def _handle_merge_vulnerability(self, vuln_id: str, update_id: str) -> Dict:
-        return self.client.merge_vulnerability(vuln_id, update_id)
-
     # =========================================================================
     # PUBLIC API METHODS (for testing and direct use)
     # =========================================================================
@@ -1680,10 +1479,7 @@ class PwnDocMCPServer:
         Returns:
             List of tool definitions
         """
-        from typing import cast
-
-        result = self._handle_list_tools({})
-        return cast(List[Dict], result.get("tools", []))
+        return self._tools_list
 
     async def handle_call_tool(self, name: str, arguments: Dict) -> Any:
         """
@@ -1699,8 +1495,77 @@ class PwnDocMCPServer:
         Raises:
             ValueError: If tool is unknown
         """
+        if name not in self._tools:
+            raise ValueError(f"Unknown tool: {name}")
+
         params = {"name": name, "arguments": arguments}
-        return self._handle_call_tool(params)
+
+        if name.startswith(self.READ_TOOL_PREFIXES):
+            call = self._coalesced_call(name, params)
+        else:
+            call = asyncio.to_thread(self._handle_call_tool, params)
+
+        try:
+            return await asyncio.wait_for(call, timeout=self.config.tool_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool {name} timed out after {self.config.tool_timeout}s")
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Error: tool call timed out after {self.config.tool_timeout}s",
+                    }
+                ],
+                "isError": True,
+            }
+
+    async def _coalesced_call(self, name: str, params: Dict) -> Any:
+        """
+        Run a read-only tool call, merging concurrent identical requests.
+
+        When several callers request the same tool with the same arguments
+        while one upstream PwnDoc request is already in flight, they all
+        await the same result instead of issuing duplicate HTTP calls.
+
+        Args:
+            name: Tool name
+            params: tools/call parameters
+
+        Returns:
+            Tool result
+        """
+        arguments = params.get("arguments", {})
+        try:
+            key = (name, tuple(sorted(arguments.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (lists/dicts) - skip coalescing
+            return await asyncio.to_thread(self._handle_call_tool, params)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future" = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await asyncio.to_thread(self._handle_call_tool, params)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                # The leader was cancelled (typically wait_for timing out in
+                # handle_call_tool); followers shielded from that cancellation
+                # should see a timeout, not a bare CancelledError
+                future.set_exception(asyncio.TimeoutError())
+            else:
+                future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody else is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
     def _format_result(self, data: Any) -> str:
         """
@@ -1716,8 +1581,16 @@ class PwnDocMCPServer:
             return data
         elif data is None:
             return "null"
+        elif (
+            isinstance(data, dict)
+            and len(data) <= 4
+            and all(isinstance(v, (str, int, float, bool, type(None))) for v in data.values())
+        ):
+            # Small flat results (success messages, counters) don't need
+            # pretty-printing; skip the indented encoder.
+            return _dumps_bytes(data).decode()
         else:
-            return json.dumps(data, indent=2, default=str)
+            return _dumps_indented(data)
 
     # =========================================================================
     # MCP PROTOCOL HANDLING
@@ -1738,37 +1611,43 @@ class PwnDocMCPServer:
             },
         }
 
-    def _handle_list_tools(self, params: Dict) -> Dict:
+    def _handle_list_tools(self, params: Dict) -> PreEncoded:
         """Handle tools/list request."""
-        tools = []
-        for tool in self._tools.values():
-            tools.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.parameters,
-                }
-            )
-        return {"tools": tools}
+        if self._tools_list_encoded is None:
+            self._tools_list_encoded = PreEncoded(_dumps_bytes({"tools": self._tools_list}))
+        return self._tools_list_encoded
 
-    def _handle_call_tool(self, params: Dict) -> Dict:
+    def _handle_call_tool(self, params: Dict) -> Union[Dict, PreEncoded]:
         """Handle tools/call request."""
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
 
-        if tool_name not in self._tools:
+        # Single dict lookup covers both the existence check and the fetch
+        if not isinstance(tool_name, str) or (tool := self._tools.get(tool_name)) is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-        tool = self._tools[tool_name]
-
         try:
             result = tool.handler(**arguments)
-            return {
-                "content": [{"type": "text", "text": json.dumps(result, indent=2, default=str)}]
-            }
+            text = _dumps_indented(result)
+            # Encode the content envelope once; transports splice the bytes
+            # into the JSON-RPC envelope without re-serializing the payload.
+            return PreEncoded(_dumps_bytes({"content": [{"type": "text", "text": text}]}))
         except PwnDocError as e:
             return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "isError": True}
 
+    def _encode_response(self, response: Dict) -> bytes:
+        """Serialize a JSON-RPC response, splicing in pre-encoded results."""
+        result = response.get("result")
+        if isinstance(result, PreEncoded):
+            return (
+                b'{"jsonrpc":"2.0","id":'
+                + _dumps_bytes(response.get("id"))
+                + b',"result":'
+                + result.data
+                + b"}"
+            )
+        return _dumps_bytes(response)
+
     def _handle_message(self, message: Dict) -> Optional[Dict]:
         """Process an incoming MCP message."""
         method = message.get("method")
@@ -1798,7 +1677,12 @@ class PwnDocMCPServer:
                     return None
                 return {"jsonrpc": "2.0", "id": msg_id, "result": result}
             except Exception as e:
-                logger.exception(f"Error handling {method}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception(f"Error handling {method}")
+                else:
+                    # Skip traceback formatting on the hot path; the message
+                    # is enough outside debug runs.
+                    logger.error(f"Error handling {method}: {e}")
                 # Only return error for requests, not notifications
                 if is_notification:
                     return None
@@ -1818,27 +1702,72 @@ class PwnDocMCPServer:
                 "error": {"code": -32601, "message": f"Method not found: {method}"},
             }
 
+    async def _handle_message_async(self, message: Dict) -> Optional[Dict]:
+        """Process an incoming MCP message without blocking the event loop.
+
+        tools/call requests are dispatched through :meth:`handle_call_tool`
+        so the per-call timeout and read coalescing apply to transport
+        traffic; every other method runs on a worker thread.
+        """
+        if message.get("method") != "tools/call":
+            return await asyncio.to_thread(self._handle_message, message)
+
+        params = message.get("params", {})
+        msg_id = message.get("id")
+        try:
+            result = await self.handle_call_tool(params.get("name"), params.get("arguments", {}))
+            return {"jsonrpc": "2.0", "id": msg_id, "result": result}
+        except Exception as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("Error handling tools/call")
+            else:
+                logger.error(f"Error handling tools/call: {e}")
+            if msg_id is None:  # Notification: no response per JSON-RPC 2.0
+                return None
+            return {
+                "jsonrpc": "2.0",
+                "id": msg_id,
+                "error": {"code": -32603, "message": str(e)},
+            }
+
     # =========================================================================
     # TRANSPORT IMPLEMENTATIONS
     # =========================================================================
 
     def run_stdio(self):
         """Run server with stdio transport (for Claude Desktop)."""
+        asyncio.run(self.run_stdio_async())
+
+    async def run_stdio_async(self):
+        """Async stdio transport loop.
+
+        Reads, message handling, serialization and writes all run in the
+        default executor, so a large response (e.g. ``list_vulnerabilities``)
+        never stalls the event loop and concurrent async work (SSE sessions,
+        coalesced calls) keeps making progress. Pipes are driven through the
+        executor rather than ``connect_write_pipe`` so the same code works on
+        Windows, where stdio pipes are not selectable.
+        """
         logger.info("Starting PwnDoc MCP Server (stdio transport)")
+        loop = asyncio.get_running_loop()
+
+        def _write_line(encoded: bytes):
+            sys.stdout.write(encoded.decode() + "\n")
+            sys.stdout.flush()
 
         while True:
             try:
-                line = sys.stdin.readline()
+                line = await loop.run_in_executor(None, sys.stdin.readline)
                 if not line:
                     break
 
                 message = json.loads(line)
                 logger.debug(f"Received: {message.get('method', 'response')}")
 
-                response = self._handle_message(message)
+                response = await self._handle_message_async(message)
                 if response:
-                    sys.stdout.write(json.dumps(response) + "\n")
-                    sys.stdout.flush()
+                    encoded = await loop.run_in_executor(None, self._encode_response, response)
+                    await loop.run_in_executor(None, _write_line, encoded)
 
             except json.JSONDecodeError as e:
                 logger.warning(f"Invalid JSON: {e}")
@@ -1848,14 +1777,30 @@ class PwnDocMCPServer:
             except Exception as e:
                 logger.exception(f"Error: {e}")
 
+    SSE_HEARTBEAT_INTERVAL = 15  # seconds between keep-alive comments
+
     async def run_sse(self, host: str = "127.0.0.1", port: int = 8080):
-        """Run server with SSE transport."""
+        """Run server with SSE transport.
+
+        Exposes two endpoints:
+        - GET /mcp/events: opens a long-lived event stream. The first event
+          carries the session id; subsequent MCP responses for that session
+          are multiplexed over the same stream.
+        - POST /mcp: accepts a JSON-RPC message. If the body contains a
+          ``session_id`` matching an open event stream, the response is
+          written to that stream and the POST returns 202 immediately.
+          Without a session_id the message is handled one-shot and the
+          response returned in the POST body (for simple clients).
+        """
         try:
             from aiohttp import web
         except ImportError:
             raise ImportError("aiohttp required for SSE transport: pip install aiohttp")
 
-        async def handle_sse(request):
+        import uuid
+
+        async def handle_events(request):
+            session_id = request.query.get("session_id") or uuid.uuid4().hex
             response = web.StreamResponse(
                 status=200,
                 headers={
@@ -1865,18 +1810,54 @@ class PwnDocMCPServer:
                 },
             )
             await response.prepare(request)
+            await response.write(f"event: session\ndata: {session_id}\n\n".encode())
 
-            # Read messages from POST body
-            data = await request.json()
-            result = self._handle_message(data)
+            self._sse_sessions[session_id] = response
+            logger.debug(f"SSE session opened: {session_id}")
 
-            if result:
-                await response.write(f"data: {json.dumps(result)}\n\n".encode())
+            try:
+                # Keep the stream open; periodic comments detect dead peers
+                # without closing the connection.
+                while True:
+                    await asyncio.sleep(self.SSE_HEARTBEAT_INTERVAL)
+                    await response.write(b": ping\n\n")
+            except (ConnectionResetError, ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                self._sse_sessions.pop(session_id, None)
+                logger.debug(f"SSE session closed: {session_id}")
 
             return response
 
+        async def dispatch_to_session(message, response):
+            result = await self._handle_message_async(message)
+            if result:
+                try:
+                    await response.write(b"data: " + self._encode_response(result) + b"\n\n")
+                except (ConnectionResetError, ConnectionError):
+                    logger.debug("SSE session dropped before response could be written")
+
+        async def handle_post(request):
+            data = await request.json()
+            session_id = data.pop("session_id", None)
+            session = self._sse_sessions.get(session_id) if session_id else None
+
+            if session is None:
+                # One-shot fallback: no open event stream for this client.
+                result = await self._handle_message_async(data)
+                if not result:
+                    return web.json_response({})
+                return web.Response(
+                    body=self._encode_response(result), content_type="application/json"
+                )
+
+            # Fire and forget so multiple in-flight calls overlap on one session.
+            asyncio.ensure_future(dispatch_to_session(data, session))
+            return web.Response(status=202)
+
         app = web.Application()
-        app.router.add_post("/mcp", handle_sse)
+        app.router.add_get("/mcp/events", handle_events)
+        app.router.add_post("/mcp", handle_post)
 
         runner = web.AppRunner(app)
         await runner.setup()
@@ -1885,9 +1866,22 @@ class PwnDocMCPServer:
 
         logger.info(f"SSE server running at http://{host}:{port}/mcp")
 
-        # Keep running
-        while True:
-            await asyncio.sleep(3600)
+        # Block until a termination signal instead of polling; gives clean
+        # shutdown in containers where SIGTERM must drain in-flight requests.
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Signal handlers are unavailable on Windows event loops
+                pass
+
+        try:
+            await stop_event.wait()
+        finally:
+            logger.info("SSE server shutting down")
+            await runner.cleanup()
 
     def run(self, transport: Optional[str] = None):
         """
@@ -1906,8 +1900,8 @@ class PwnDocMCPServer:
             raise ValueError(f"Unsupported transport: {transport}")
 
 
-# Module-level constant for tool definitions (for compatibility)
-TOOL_DEFINITIONS: Optional[List[Dict]] = None
+# Cache behind the lazy TOOL_DEFINITIONS module attribute (PEP 562)
+_TOOL_DEFINITIONS_CACHE: Optional[List[Dict]] = None
 
 
 def _get_tool_definitions() -> List[Dict]:
@@ -1921,16 +1915,7 @@ def _get_tool_definitions() -> List[Dict]:
     # Use _silent=True to prevent logging during module import
     config = Config(url="http://temp", token="temp")
     server = PwnDocMCPServer(config, _silent=True)
-    tools = []
-    for tool in server._tools.values():
-        tools.append(
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.parameters,
-            }
-        )
-    return tools
+    return server._tools_list
 
 
 def get_tool_definitions() -> List[Dict]:
@@ -1940,10 +1925,17 @@ def get_tool_definitions() -> List[Dict]:
     Returns:
         List of tool definitions
     """
-    global TOOL_DEFINITIONS
-    if TOOL_DEFINITIONS is None:
-        TOOL_DEFINITIONS = _get_tool_definitions()
-    return TOOL_DEFINITIONS
+    global _TOOL_DEFINITIONS_CACHE
+    if _TOOL_DEFINITIONS_CACHE is None:
+        _TOOL_DEFINITIONS_CACHE = _get_tool_definitions()
+    return _TOOL_DEFINITIONS_CACHE
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve TOOL_DEFINITIONS lazily so importing the module stays cheap."""
+    if name == "TOOL_DEFINITIONS":
+        return get_tool_definitions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_server(config: Optional[Config] = None, **kwargs) -> PwnDocMCPServer:
@@ -16,35 +16,15 @@ import pytest
 
 
 @pytest.fixture(autouse=True)
-def clean_environment() -> Generator[None, None, None]:
-    """Clean environment variables before each test."""
-    env_vars = [
-        "PWNDOC_URL",
-        "PWNDOC_USERNAME",
-        "PWNDOC_PASSWORD",
-        "PWNDOC_TOKEN",
-        "PWNDOC_VERIFY_SSL",
-        "PWNDOC_TIMEOUT",
-        "PWNDOC_MAX_RETRIES",
-        "PWNDOC_LOG_LEVEL",
-        "PWNDOC_LOG_FILE",
-        "PWNDOC_CONFIG_FILE",
-    ]
-    # Store original values
-    original = {k: os.environ.get(k) for k in env_vars}
-
-    # Clear all
-    for var in env_vars:
-        os.environ.pop(var, None)
-
-    yield
-
-    # Restore original values
-    for var, value in original.items():
-        if value is not None:
-            os.environ[var] = value
-        else:
-            os.environ.pop(var, None)
+def _clean_pwndoc_env(monkeypatch) -> None:
+    """Clear the whole PWNDOC_* env namespace before each test.
+
+    monkeypatch restores the original values automatically, so tests can
+    neither see nor leak PWNDOC_* settings from the host or each other.
+    """
+    for key in list(os.environ):
+        if key.startswith("PWNDOC_"):
+            monkeypatch.delenv(key, raising=False)
 
 
 @pytest.fixture
@@ -62,6 +42,14 @@ def temp_config_file(temp_dir: str) -> str:
     return config_path
 
 
+@pytest.fixture(scope="session")
+def valid_config():
+    """Minimal valid Config, shared across tests that only read it."""
+    from pwndoc_mcp_server.config import Config
+
+    return Config(url="https://pwndoc.test.com", token="test-token")
+
+
 # ============================================================================
 # Mock Data Fixtures
 # ============================================================================
@@ -219,34 +207,51 @@ def mock_statistics() -> Dict[str, Any]:
 # ============================================================================
 
 
+def _default_client_stubs(client: AsyncMock) -> None:
+    """Install the default method stubs on a mock PwnDoc client."""
+    client.authenticate = AsyncMock(return_value=True)
+    client.list_audits = AsyncMock(return_value=[])
+    client.get_audit = AsyncMock(return_value={})
+    client.list_clients = AsyncMock(return_value=[])
+    client.list_companies = AsyncMock(return_value=[])
+    client.list_vulnerabilities = AsyncMock(return_value=[])
+    client.list_users = AsyncMock(return_value=[])
+    client.get_statistics = AsyncMock(return_value={})
+
+
+@pytest.fixture(scope="module")
+def _shared_pwndoc_client():
+    """Module-scoped mock PwnDoc client (built once, reset per test)."""
+    client = AsyncMock()
+    _default_client_stubs(client)
+    return client
+
+
 @pytest.fixture
-def mock_pwndoc_client():
-    """Create a mock PwnDoc client."""
-    with patch("pwndoc_mcp_server.client.PwnDocClient") as MockClient:
-        client = AsyncMock()
-        MockClient.return_value = client
+def mock_pwndoc_client(_shared_pwndoc_client):
+    """Create a mock PwnDoc client (patched only while the test runs)."""
+    # Full reset wipes configured return values/side effects from earlier
+    # tests, so reapply the default stubs afterwards
+    _shared_pwndoc_client.reset_mock(return_value=True, side_effect=True)
+    _default_client_stubs(_shared_pwndoc_client)
+    with patch("pwndoc_mcp_server.client.PwnDocClient", return_value=_shared_pwndoc_client):
+        yield _shared_pwndoc_client
 
-        # Setup default responses
-        client.authenticate = AsyncMock(return_value=True)
-        client.list_audits = AsyncMock(return_value=[])
-        client.get_audit = AsyncMock(return_value={})
-        client.list_clients = AsyncMock(return_value=[])
-        client.list_companies = AsyncMock(return_value=[])
-        client.list_vulnerabilities = AsyncMock(return_value=[])
-        client.list_users = AsyncMock(return_value=[])
-        client.get_statistics = AsyncMock(return_value={})
 
-        yield client
+@pytest.fixture(scope="module")
+def _shared_httpx_client():
+    """Module-scoped mock httpx async client (built once, reset per test)."""
+    return AsyncMock()
 
 
 @pytest.fixture
-def mock_httpx_client():
-    """Create a mock httpx async client."""
+def mock_httpx_client(_shared_httpx_client):
+    """Create a mock httpx async client (patched only while the test runs)."""
+    _shared_httpx_client.reset_mock(return_value=True, side_effect=True)
     with patch("httpx.AsyncClient") as MockAsyncClient:
-        client = AsyncMock()
-        MockAsyncClient.return_value.__aenter__ = AsyncMock(return_value=client)
+        MockAsyncClient.return_value.__aenter__ = AsyncMock(return_value=_shared_httpx_client)
         MockAsyncClient.return_value.__aexit__ = AsyncMock(return_value=None)
-        yield client
+        yield _shared_httpx_client
 
 
 # ============================================================================
@@ -290,14 +295,28 @@ def mock_error_response() -> Dict[str, Any]:
 # ============================================================================
 
 
-@pytest.fixture
-def cli_runner():
-    """Create a CLI test runner."""
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI test runner (stateless across invokes, shared per session)."""
     from typer.testing import CliRunner
 
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def cli_runner(runner):
+    """Create a CLI test runner."""
+    return runner
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli(runner):
+    """Materialize Typer's command tree once so tests skip re-registration."""
+    from pwndoc_mcp_server.cli import app
+
+    runner.invoke(app, ["--help"])
+
+
 # ============================================================================
 # Server Fixtures
 # ============================================================================
@@ -1,12 +1,14 @@
 """Tests for PwnDoc MCP Server."""
 
-from unittest.mock import AsyncMock, patch
-
+import httpx
 import pytest
 
-from pwndoc_mcp_server.client import PwnDocClient
+from pwndoc_mcp_server.client import PwnDocAsyncClient, PwnDocClient
 from pwndoc_mcp_server.config import Config
 
+# Shared read-only config; copy via dataclasses.replace() if a test must mutate
+_TOKEN_CONFIG = Config(url="https://test.com", token="test-token")
+
 
 class TestConfig:
     """Tests for configuration."""
@@ -21,33 +23,24 @@ class TestConfig:
         assert config.url == "https://test.com"
         assert config.token == "test-token"
 
-    def test_config_validate_missing_url(self):
-        """Test validation catches missing URL."""
-        config = Config(token="test")
-        errors = config.validate()
-
-        assert "PWNDOC_URL is required" in errors
-
-    def test_config_validate_missing_auth(self):
-        """Test validation catches missing auth."""
-        config = Config(url="https://test.com")
-        errors = config.validate()
-
-        assert any("PWNDOC_TOKEN" in e or "PWNDOC_USERNAME" in e for e in errors)
-
-    def test_config_validate_success_with_token(self):
-        """Test validation passes with token."""
-        config = Config(url="https://test.com", token="test-token")
-        errors = config.validate()
-
-        assert len(errors) == 0
-
-    def test_config_validate_success_with_password(self):
-        """Test validation passes with username/password."""
-        config = Config(url="https://test.com", username="user", password="pass")
-        errors = config.validate()
-
-        assert len(errors) == 0
+    @pytest.mark.parametrize(
+        "kwargs,expect_errors",
+        [
+            ({"token": "test"}, True),
+            ({"url": "https://test.com"}, True),
+            ({"url": "https://test.com", "token": "test-token"}, False),
+            ({"url": "https://test.com", "username": "user", "password": "pass"}, False),
+        ],
+        ids=["missing-url", "missing-auth", "token", "credentials"],
+    )
+    def test_config_validate(self, kwargs, expect_errors):
+        """Test validation across missing-url/missing-auth/valid configs."""
+        errors = Config(**kwargs).validate()
+
+        if expect_errors:
+            assert len(errors) > 0
+        else:
+            assert len(errors) == 0
 
 
 class TestClient:
@@ -65,38 +58,131 @@ class TestClient:
     @pytest.mark.asyncio
     async def test_client_from_config(self):
         """Test creating client from config."""
-        config = Config(
-            url="https://test.com",
-            token="test-token",
-        )
-        client = PwnDocClient.from_config(config)
+        client = PwnDocClient.from_config(_TOKEN_CONFIG)
 
         assert client.url == "https://test.com"
         assert client.token == "test-token"
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_test_connection_success(self, client):
+    async def test_test_connection_success(self, client, monkeypatch):
         """Test successful connection test."""
-        with patch.object(client, "get_current_user", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = {"datas": {"username": "testuser"}}
 
-            result = await client.test_connection()
+        async def fake_get_current_user():
+            return {"datas": {"username": "testuser"}}
+
+        monkeypatch.setattr(client, "get_current_user", fake_get_current_user)
 
-            assert result["status"] == "ok"
-            assert result["user"] == "testuser"
+        result = await client.test_connection()
+
+        assert result["status"] == "ok"
+        assert result["user"] == "testuser"
 
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_test_connection_failure(self, client):
+    async def test_test_connection_failure(self, client, monkeypatch):
         """Test failed connection test."""
-        with patch.object(client, "_ensure_token", new_callable=AsyncMock) as mock_token:
-            mock_token.side_effect = Exception("Connection failed")
 
-            result = await client.test_connection()
+        async def fake_ensure_token():
+            raise Exception("Connection failed")
+
+        monkeypatch.setattr(client, "_ensure_token", fake_ensure_token)
+
+        result = await client.test_connection()
+
+        assert result["status"] == "error"
+        assert "Connection failed" in result["error"]
+
+        await client.close()
+
+
+class TestAsyncClient:
+    """Tests for async PwnDoc client."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test async client."""
+        return PwnDocAsyncClient(
+            url="https://test.pwndoc.com",
+            token="test-token",
+            verify_ssl=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_client_from_config(self):
+        """Test creating async client from config."""
+        client = PwnDocAsyncClient.from_config(_TOKEN_CONFIG)
+
+        assert client.url == "https://test.com"
+        assert client.token == "test-token"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_auth_headers(self, client):
+        """Test that the JWT token is sent in the Cookie header."""
+        headers = client._get_headers()
+
+        assert headers["Cookie"] == "token=JWT test-token"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_audits(self, client, monkeypatch):
+        """Test listing audits via the async request path."""
+
+        async def fake_request(method, endpoint, **kwargs):
+            assert method == "GET"
+            assert endpoint == "/api/audits"
+            return {"datas": [{"name": "Test Audit"}]}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+
+        audits = await client.list_audits()
+
+        assert audits == [{"name": "Test Audit"}]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_current_user(self, client, monkeypatch):
+        """Test fetching the current user."""
+
+        async def fake_request(method, endpoint, **kwargs):
+            assert method == "GET"
+            assert endpoint == "/api/users/me"
+            return {"datas": {"username": "testuser"}}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+
+        user = await client.get_current_user()
+
+        assert user["username"] == "testuser"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_request_retries_after_401(self, client, monkeypatch):
+        """Test that a 401 triggers a token refresh and a retry."""
+        responses = [
+            httpx.Response(401),
+            httpx.Response(200, json={"datas": []}),
+        ]
+        refreshed = []
+
+        async def fake_http_request(method, url, **kwargs):
+            return responses.pop(0)
+
+        async def fake_refresh():
+            refreshed.append(True)
+            return True
+
+        monkeypatch.setattr(client._client, "request", fake_http_request)
+        monkeypatch.setattr(client, "refresh_authentication", fake_refresh)
+
+        result = await client._request("GET", "/api/audits")
 
-            assert result["status"] == "error"
-            assert "Connection failed" in result["error"]
+        assert result == {"datas": []}
+        assert refreshed
 
         await client.close()
@@ -5,6 +5,7 @@ Tests for the configuration module.
 import json
 import os
 
+import pytest
 import yaml
 
 from pwndoc_mcp_server.config import (
@@ -14,6 +15,11 @@ from pwndoc_mcp_server.config import (
     save_config,
 )
 
+# Static config file payloads (pre-serialized so tests skip the YAML emitter)
+_YAML_BASIC = "url: https://yaml.pwndoc.com\nusername: yamluser\npassword: yamlpass\ntimeout: 60\n"
+_YAML_FILE_ONLY = "url: https://file.pwndoc.com\nusername: fileuser\n"
+_JSON_BASIC = '{"url": "https://json.pwndoc.com", "username": "jsonuser", "password": "jsonpass"}'
+
 
 class TestConfig:
     """Tests for Config dataclass."""
@@ -52,25 +58,35 @@ class TestConfig:
         assert config.max_retries == 5
         assert config.log_level == "DEBUG"
 
-    def test_is_valid_with_token(self):
-        """Test config validation with token."""
-        config = Config(url="https://pwndoc.example.com", token="jwt-token-here")
-        assert config.is_valid() is True
-
-    def test_is_valid_with_credentials(self):
-        """Test config validation with username/password."""
-        config = Config(url="https://pwndoc.example.com", username="admin", password="secret")
-        assert config.is_valid() is True
-
-    def test_is_invalid_no_url(self):
-        """Test config validation without URL."""
-        config = Config(username="admin", password="secret")
-        assert config.is_valid() is False
-
-    def test_is_invalid_no_auth(self):
-        """Test config validation without auth."""
-        config = Config(url="https://pwndoc.example.com")
-        assert config.is_valid() is False
+    @pytest.mark.parametrize(
+        "url,username,password,token,ok",
+        [
+            ("", "", "", "", False),
+            ("https://pwndoc.example.com", "", "", "", False),
+            ("https://pwndoc.example.com", "", "", "jwt-token-here", True),
+            ("https://pwndoc.example.com", "admin", "secret", "", True),
+            ("https://pwndoc.example.com", "admin", "", "", False),
+            ("https://pwndoc.example.com", "", "secret", "", False),
+            ("https://pwndoc.example.com", "admin", "secret", "jwt-token-here", True),
+            ("", "admin", "secret", "", False),
+            ("", "", "", "jwt-token-here", False),
+        ],
+        ids=[
+            "empty",
+            "url-only",
+            "token",
+            "credentials",
+            "username-only",
+            "password-only",
+            "token-and-credentials",
+            "credentials-no-url",
+            "token-no-url",
+        ],
+    )
+    def test_is_valid(self, url, username, password, token, ok):
+        """Test config validation across the url/auth combination matrix."""
+        config = Config(url=url, username=username, password=password, token=token)
+        assert config.is_valid() is ok
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -97,13 +113,13 @@ class TestConfig:
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_from_environment(self):
+    def test_load_from_environment(self, monkeypatch):
         """Test loading config from environment variables."""
-        os.environ["PWNDOC_URL"] = "https://env.pwndoc.com"
-        os.environ["PWNDOC_USERNAME"] = "envuser"
-        os.environ["PWNDOC_PASSWORD"] = "envpass"
-        os.environ["PWNDOC_VERIFY_SSL"] = "false"
-        os.environ["PWNDOC_TIMEOUT"] = "45"
+        monkeypatch.setenv("PWNDOC_URL", "https://env.pwndoc.com")
+        monkeypatch.setenv("PWNDOC_USERNAME", "envuser")
+        monkeypatch.setenv("PWNDOC_PASSWORD", "envpass")
+        monkeypatch.setenv("PWNDOC_VERIFY_SSL", "false")
+        monkeypatch.setenv("PWNDOC_TIMEOUT", "45")
 
         config = load_config()
 
@@ -113,54 +129,36 @@ class TestLoadConfig:
         assert config.verify_ssl is False
         assert config.timeout == 45
 
-    def test_load_from_yaml_file(self, temp_dir):
+    def test_load_from_yaml_file(self, tmp_path, monkeypatch):
         """Test loading config from YAML file."""
-        config_data = {
-            "url": "https://yaml.pwndoc.com",
-            "username": "yamluser",
-            "password": "yamlpass",
-            "timeout": 60,
-        }
-
-        config_path = os.path.join(temp_dir, "config.yaml")
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
-
-        os.environ["PWNDOC_CONFIG_FILE"] = config_path
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(_YAML_BASIC)
+
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", str(config_path))
         config = load_config()
 
         assert config.url == "https://yaml.pwndoc.com"
         assert config.username == "yamluser"
         assert config.timeout == 60
 
-    def test_load_from_json_file(self, temp_dir):
+    def test_load_from_json_file(self, tmp_path, monkeypatch):
         """Test loading config from JSON file."""
-        config_data = {
-            "url": "https://json.pwndoc.com",
-            "username": "jsonuser",
-            "password": "jsonpass",
-        }
-
-        config_path = os.path.join(temp_dir, "config.json")
-        with open(config_path, "w") as f:
-            json.dump(config_data, f)
+        config_path = tmp_path / "config.json"
+        config_path.write_text(_JSON_BASIC)
 
-        os.environ["PWNDOC_CONFIG_FILE"] = config_path
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", str(config_path))
         config = load_config()
 
         assert config.url == "https://json.pwndoc.com"
         assert config.username == "jsonuser"
 
-    def test_env_overrides_file(self, temp_dir):
+    def test_env_overrides_file(self, tmp_path, monkeypatch):
         """Test that environment variables override file config."""
-        config_data = {"url": "https://file.pwndoc.com", "username": "fileuser"}
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(_YAML_FILE_ONLY)
 
-        config_path = os.path.join(temp_dir, "config.yaml")
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
-
-        os.environ["PWNDOC_CONFIG_FILE"] = config_path
-        os.environ["PWNDOC_URL"] = "https://env.pwndoc.com"
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", str(config_path))
+        monkeypatch.setenv("PWNDOC_URL", "https://env.pwndoc.com")
 
         config = load_config()
 
@@ -169,18 +167,18 @@ class TestLoadConfig:
         # File value should still be used where env not set
         assert config.username == "fileuser"
 
-    def test_load_nonexistent_file(self):
+    def test_load_nonexistent_file(self, monkeypatch):
         """Test loading from nonexistent file returns defaults."""
-        os.environ["PWNDOC_CONFIG_FILE"] = "/nonexistent/path/config.yaml"
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", "/nonexistent/path/config.yaml")
 
         config = load_config()
 
         assert config.url == ""
         assert config.username == ""
 
-    def test_boolean_parsing(self):
-        """Test boolean value parsing from environment."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
             ("true", True),
             ("True", True),
             ("TRUE", True),
@@ -190,61 +188,60 @@ class TestLoadConfig:
             ("False", False),
             ("0", False),
             ("no", False),
-        ]
-
-        for value, expected in test_cases:
-            os.environ["PWNDOC_VERIFY_SSL"] = value
-            config = load_config()
-            assert config.verify_ssl is expected, f"Failed for value: {value}"
+        ],
+    )
+    def test_boolean_parsing(self, monkeypatch, value, expected):
+        """Test boolean value parsing from environment."""
+        monkeypatch.setenv("PWNDOC_VERIFY_SSL", value)
+        config = load_config()
+        assert config.verify_ssl is expected, f"Failed for value: {value}"
 
 
 class TestSaveConfig:
     """Tests for save_config function."""
 
-    def test_save_yaml_config(self, temp_dir):
+    def test_save_yaml_config(self, tmp_path):
         """Test saving config to YAML file."""
         config = Config(url="https://save.pwndoc.com", username="saveuser", password="savepass")
 
-        config_path = os.path.join(temp_dir, "config.yaml")
-        save_config(config, config_path)
+        config_path = tmp_path / "config.yaml"
+        save_config(config, str(config_path))
 
-        assert os.path.exists(config_path)
+        assert config_path.exists()
 
-        with open(config_path, "r") as f:
-            saved_data = yaml.safe_load(f)
+        saved_data = yaml.safe_load(config_path.read_text())
 
         assert saved_data["url"] == "https://save.pwndoc.com"
         assert saved_data["username"] == "saveuser"
 
-    def test_save_json_config(self, temp_dir):
+    def test_save_json_config(self, tmp_path):
         """Test saving config to JSON file."""
         config = Config(url="https://save.pwndoc.com", username="saveuser")
 
-        config_path = os.path.join(temp_dir, "config.json")
-        save_config(config, config_path)
+        config_path = tmp_path / "config.json"
+        save_config(config, str(config_path))
 
-        assert os.path.exists(config_path)
+        assert config_path.exists()
 
-        with open(config_path, "r") as f:
-            saved_data = json.load(f)
+        saved_data = json.loads(config_path.read_text())
 
         assert saved_data["url"] == "https://save.pwndoc.com"
 
-    def test_save_creates_directory(self, temp_dir):
+    def test_save_creates_directory(self, tmp_path):
         """Test that save creates parent directories."""
         config = Config(url="https://test.com")
 
-        nested_path = os.path.join(temp_dir, "nested", "dir", "config.yaml")
-        save_config(config, nested_path)
+        nested_path = tmp_path / "nested" / "dir" / "config.yaml"
+        save_config(config, str(nested_path))
 
-        assert os.path.exists(nested_path)
+        assert nested_path.exists()
 
-    def test_save_file_permissions(self, temp_dir):
+    def test_save_file_permissions(self, tmp_path):
         """Test that saved config has secure permissions."""
         config = Config(url="https://test.com", password="secret")
 
-        config_path = os.path.join(temp_dir, "config.yaml")
-        save_config(config, config_path)
+        config_path = tmp_path / "config.yaml"
+        save_config(config, str(config_path))
 
         # Check file permissions (should be 600 on Unix)
         if os.name != "nt":  # Skip on Windows
@@ -262,18 +259,18 @@ class TestGetConfigPath:
         assert ".pwndoc-mcp" in path
         assert path.endswith("config.yaml")
 
-    def test_custom_path_from_env(self, temp_dir):
+    def test_custom_path_from_env(self, tmp_path, monkeypatch):
         """Test custom path from environment."""
-        custom_path = os.path.join(temp_dir, "custom.yaml")
-        os.environ["PWNDOC_CONFIG_FILE"] = custom_path
+        custom_path = str(tmp_path / "custom.yaml")
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", custom_path)
 
         path = get_config_path()
 
         assert path == custom_path
 
-    def test_path_expansion(self):
+    def test_path_expansion(self, monkeypatch):
         """Test that ~ is expanded in path."""
-        os.environ["PWNDOC_CONFIG_FILE"] = "~/custom/config.yaml"
+        monkeypatch.setenv("PWNDOC_CONFIG_FILE", "~/custom/config.yaml")
 
         path = get_config_path()
 
@@ -12,6 +12,12 @@ from pwndoc_mcp_server.logging_config import (
 )
 
 
+def _drain(logger):
+    """Flush buffered records through to the file sink so reads see them."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
@@ -53,9 +59,7 @@ class TestSetupLogging:
         logger = setup_logging(log_file=log_file)
         logger.info("Test message")
 
-        # Flush handlers
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         assert os.path.exists(log_file)
         with open(log_file, "r") as f:
@@ -82,8 +86,7 @@ class TestSetupLogging:
         logger = setup_logging(log_file=log_file, log_format="json")
         logger.info("Test JSON message")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         with open(log_file, "r") as f:
             content = f.read()
@@ -122,8 +125,7 @@ class TestSetupLogging:
         logger = setup_logging()
         logger.info("Env file test")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         assert os.path.exists(log_file)
 
@@ -191,8 +193,7 @@ class TestLoggingIntegration:
         logger = setup_logging(log_file=log_file, log_format="detailed")
         logger.info("Format test message")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         with open(log_file, "r") as f:
             content = f.read()
@@ -211,8 +212,7 @@ class TestLoggingIntegration:
         except ValueError:
             logger.exception("Caught exception")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         with open(log_file, "r") as f:
             content = f.read()
@@ -225,8 +225,7 @@ class TestLoggingIntegration:
         logger = setup_logging(log_file=log_file)
         logger.info("Message with extra", extra={"audit_id": "123"})
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         # Extra fields handling depends on formatter
 
@@ -248,8 +247,7 @@ class TestLoggingIntegration:
         logger = setup_logging(log_file=log_file)
         logger.info("Nested directory test")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         assert os.path.exists(log_file)
 
@@ -260,8 +258,7 @@ class TestLoggingIntegration:
         logger = setup_logging(log_file=log_file)
         logger.info("Unicode test: 日本語 العربية 中文")
 
-        for handler in logger.handlers:
-            handler.flush()
+        _drain(logger)
 
         with open(log_file, "r", encoding="utf-8") as f:
             content = f.read()
@@ -2,7 +2,9 @@
 Tests for the MCP server module.
 """
 
+import asyncio
 import json
+import time
 from unittest.mock import patch
 
 import pytest
@@ -15,6 +17,12 @@ from pwndoc_mcp_server.server import (
 )
 
 
+@pytest.fixture(scope="session")
+def tool_names():
+    """Tool names as a frozenset, built once for O(1) membership checks."""
+    return frozenset(t["name"] for t in get_tool_definitions())
+
+
 class TestToolDefinitions:
     """Tests for tool definitions."""
 
@@ -38,11 +46,8 @@ class TestToolDefinitions:
             assert schema["type"] == "object"
             assert "properties" in schema
 
-    def test_audit_tools_exist(self):
+    def test_audit_tools_exist(self, tool_names):
         """Test that audit tools are defined."""
-        tool_defs = get_tool_definitions()
-        tool_names = [t["name"] for t in tool_defs]
-
         expected_audit_tools = [
             "list_audits",
             "get_audit",
@@ -55,11 +60,8 @@ class TestToolDefinitions:
         for tool in expected_audit_tools:
             assert tool in tool_names, f"Missing tool: {tool}"
 
-    def test_finding_tools_exist(self):
+    def test_finding_tools_exist(self, tool_names):
         """Test that finding tools are defined."""
-        tool_defs = get_tool_definitions()
-        tool_names = [t["name"] for t in tool_defs]
-
         expected_finding_tools = [
             "get_audit_findings",
             "get_finding",
@@ -71,11 +73,8 @@ class TestToolDefinitions:
         for tool in expected_finding_tools:
             assert tool in tool_names, f"Missing tool: {tool}"
 
-    def test_client_tools_exist(self):
+    def test_client_tools_exist(self, tool_names):
         """Test that client tools are defined."""
-        tool_defs = get_tool_definitions()
-        tool_names = [t["name"] for t in tool_defs]
-
         expected_client_tools = [
             "list_clients",
             "create_client",
@@ -86,11 +85,8 @@ class TestToolDefinitions:
         for tool in expected_client_tools:
             assert tool in tool_names, f"Missing tool: {tool}"
 
-    def test_special_tools_exist(self):
+    def test_special_tools_exist(self, tool_names):
         """Test that special aggregate tools are defined."""
-        tool_defs = get_tool_definitions()
-        tool_names = [t["name"] for t in tool_defs]
-
         assert "get_all_findings_with_context" in tool_names
         assert "search_findings" in tool_names
         assert "get_statistics" in tool_names
@@ -114,6 +110,13 @@ class TestPwnDocMCPServer:
         assert server.config == config
         assert server.client is not None
 
+    def test_client_created_lazily(self, config):
+        """Test that the HTTP client is not built until first access."""
+        server = PwnDocMCPServer(config)
+
+        assert server._client is None
+        assert server.client is not None
+
     def test_server_name(self, server):
         """Test server name."""
         assert server.name == "pwndoc-mcp-server"
@@ -191,6 +194,55 @@ class TestPwnDocMCPServer:
         with pytest.raises(ValueError, match="Unknown tool"):
             await server.handle_call_tool("unknown_tool", {})
 
+    @pytest.mark.asyncio
+    async def test_tools_call_routed_through_handle_call_tool(self, server, monkeypatch):
+        """Test transports dispatch tools/call via the timeout/coalescing path."""
+        calls = []
+
+        async def fake_handle_call_tool(name, arguments):
+            calls.append((name, arguments))
+            return {"content": [{"type": "text", "text": "ok"}]}
+
+        monkeypatch.setattr(server, "handle_call_tool", fake_handle_call_tool)
+
+        response = await server._handle_message_async(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "list_audits", "arguments": {}},
+            }
+        )
+
+        assert calls == [("list_audits", {})]
+        assert response["result"]["content"][0]["text"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transport_reads_coalesce(self, server):
+        """Test identical concurrent tools/call reads share one upstream call."""
+        calls = []
+
+        def slow_list_audits(**kwargs):
+            calls.append(1)
+            time.sleep(0.2)
+            return []
+
+        server._tools["list_audits"].handler = slow_list_audits
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "list_audits", "arguments": {}},
+        }
+
+        first, second = await asyncio.gather(
+            server._handle_message_async(message),
+            server._handle_message_async({**message, "id": 2}),
+        )
+
+        assert len(calls) == 1
+        assert "error" not in first and "error" not in second
+
     @pytest.mark.asyncio
     async def test_handle_call_tool_with_filter(self, server, mock_audit):
         """Test calling list_audits with filter."""
@@ -7,109 +7,184 @@ import sys
 import os
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import PackageNotFoundError, metadata
 
-print("=== PwnDoc MCP Server Diagnostic Tool ===\n")
+# orjson parses the raw config bytes without a UTF-8 decode round-trip; the
+# stdlib is a fine fallback on machines without the perf extra installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-# 1. Check Python version
-print(f"1. Python Version: {sys.version}")
-print(f"   Python Executable: {sys.executable}\n")
 
-# 2. Check pwndoc-mcp-server installation
-print("2. Checking pwndoc-mcp-server installation...")
-try:
-    result = subprocess.run(
-        [sys.executable, "-m", "pip", "show", "pwndoc-mcp-server"],
-        capture_output=True,
-        text=True,
+def check_python():
+    lines = ["1. Python Version: " + sys.version]
+    lines.append(f"   Python Executable: {sys.executable}\n")
+    return lines
+
+
+def check_installation():
+    # importlib.metadata reads the installed dist-info directly, so no second
+    # interpreter (and no pip import) is spawned just to print the version
+    lines = ["2. Checking pwndoc-mcp-server installation..."]
+    try:
+        md = metadata("pwndoc-mcp-server")
+        lines.append(f"   Name: {md['Name']}")
+        lines.append(f"   Version: {md['Version']}\n")
+    except PackageNotFoundError:
+        lines.append("   NOT INSTALLED\n")
+    except Exception as e:
+        lines.append(f"   ERROR: {e}\n")
+    return lines
+
+
+def check_module_location():
+    lines = ["3. Checking actual module location..."]
+    try:
+        import pwndoc_mcp_server
+        # __file__ on a freshly imported module gives the same answer as
+        # inspect.getfile without dragging in the inspect module
+        module_file = getattr(pwndoc_mcp_server, '__file__', '<builtin>')
+        lines.append(f"   Module loaded from: {module_file}")
+        lines.append(f"   Module version: {pwndoc_mcp_server.__version__}\n")
+    except Exception as e:
+        lines.append(f"   ERROR: {e}\n")
+    return lines
+
+
+def check_nuclear_fix():
+    lines = ["4. Checking for nuclear fix..."]
+    try:
+        import pwndoc_mcp_server
+        has_fix = hasattr(pwndoc_mcp_server, '_devnull')
+        lines.append(f"   Nuclear fix present: {has_fix}")
+        if not has_fix:
+            lines.append("   ⚠️  WARNING: Nuclear fix NOT found in installed version!")
+            lines.append("   This is the likely cause of your Zod validation errors.\n")
+        else:
+            lines.append("   ✅ Nuclear fix is present.\n")
+    except Exception as e:
+        lines.append(f"   ERROR: {e}\n")
+    return lines
+
+
+def check_claude_config():
+    lines = ["5. Checking Claude Desktop configuration..."]
+    # Both historical candidate paths point at the same roaming profile dir, so
+    # a single directory scan replaces the per-path existence probes
+    roaming = os.environ.get('APPDATA') or os.path.join(
+        os.environ.get('USERPROFILE', ''), 'AppData', 'Roaming'
     )
-    print(result.stdout)
-except Exception as e:
-    print(f"   ERROR: {e}\n")
+    claude_dir = os.path.join(roaming, 'Claude')
 
-# 3. Check actual module location
-print("3. Checking actual module location...")
-try:
-    import pwndoc_mcp_server
-    import inspect
-    module_file = inspect.getfile(pwndoc_mcp_server)
-    print(f"   Module loaded from: {module_file}")
-    print(f"   Module version: {pwndoc_mcp_server.__version__}\n")
-except Exception as e:
-    print(f"   ERROR: {e}\n")
-
-# 4. Check for nuclear fix
-print("4. Checking for nuclear fix...")
-try:
-    import pwndoc_mcp_server
-    has_fix = hasattr(pwndoc_mcp_server, '_devnull')
-    print(f"   Nuclear fix present: {has_fix}")
-    if not has_fix:
-        print("   ⚠️  WARNING: Nuclear fix NOT found in installed version!")
-        print("   This is the likely cause of your Zod validation errors.\n")
-    else:
-        print("   ✅ Nuclear fix is present.\n")
-except Exception as e:
-    print(f"   ERROR: {e}\n")
-
-# 5. Check Claude Desktop config
-print("5. Checking Claude Desktop configuration...")
-config_paths = [
-    os.path.join(os.environ.get('APPDATA', ''), 'Claude', 'claude_desktop_config.json'),
-    os.path.join(os.environ.get('USERPROFILE', ''), 'AppData', 'Roaming', 'Claude', 'claude_desktop_config.json'),
-]
+    config_found = False
+    config_entry = None
+    try:
+        with os.scandir(claude_dir) as entries:
+            config_entry = next(
+                (e for e in entries if e.name == 'claude_desktop_config.json'), None
+            )
+    except OSError:
+        pass
 
-config_found = False
-for config_path in config_paths:
-    if os.path.exists(config_path):
-        print(f"   Config found at: {config_path}")
+    if config_entry is not None:
+        lines.append(f"   Config found at: {config_entry.path}")
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                if 'mcpServers' in config and 'pwndoc' in config['mcpServers']:
-                    print(f"   PwnDoc MCP Server config:")
-                    print(f"   {json.dumps(config['mcpServers']['pwndoc'], indent=4)}\n")
-                    config_found = True
+            with open(config_entry.path, 'rb') as f:
+                config = _loads(f.read())
+            if 'mcpServers' in config and 'pwndoc' in config['mcpServers']:
+                lines.append("   PwnDoc MCP Server config:")
+                lines.append(f"   {json.dumps(config['mcpServers']['pwndoc'], indent=4)}\n")
+                config_found = True
         except Exception as e:
-            print(f"   ERROR reading config: {e}\n")
+            lines.append(f"   ERROR reading config: {e}\n")
 
-if not config_found:
-    print("   ⚠️  WARNING: Could not find Claude Desktop config or pwndoc server config.\n")
+    if not config_found:
+        lines.append("   ⚠️  WARNING: Could not find Claude Desktop config or pwndoc server config.\n")
+    return lines
 
-# 6. Test stdout pollution
-print("6. Testing for stdout pollution...")
-import io
-original_stdout = sys.stdout
-captured = io.StringIO()
-sys.stdout = captured
 
-try:
-    # Force reimport
-    if 'pwndoc_mcp_server' in sys.modules:
-        del sys.modules['pwndoc_mcp_server']
-
-    import pwndoc_mcp_server
-    from pwndoc_mcp_server.server import get_tool_definitions
-    tools = get_tool_definitions()
-except Exception as e:
-    sys.stdout = original_stdout
-    print(f"   ERROR during import: {e}")
-finally:
-    sys.stdout = original_stdout
-
-captured_output = captured.getvalue()
-if captured_output:
-    print(f"   ⚠️  STDOUT POLLUTION DETECTED! ({len(captured_output)} bytes)")
-    print(f"   Content: {repr(captured_output[:200])}")
-    if len(captured_output) > 200:
-        print(f"   ... (truncated, {len(captured_output) - 200} more bytes)")
-    print()
-else:
-    print("   ✅ No stdout pollution detected.\n")
-
-# 7. Summary
-print("=== SUMMARY ===")
-print("If you see 'Nuclear fix NOT found' above, you need to reinstall:")
-print("  pip uninstall pwndoc-mcp-server -y")
-print("  pip install pwndoc-mcp-server --force-reinstall --no-cache-dir")
-print("\nIf you see 'STDOUT POLLUTION DETECTED', please share the output with Claude.")
-print("\nAfter any fixes, restart Claude Desktop completely.")
+def check_stdout_pollution():
+    # A child process with its real stdout piped catches byte-level fd 1 writes
+    # (the actual Zod failure mode) that a StringIO swap would miss, and leaves
+    # this interpreter's module cache untouched
+    lines = ["6. Testing for stdout pollution..."]
+    captured_output = ''
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import pwndoc_mcp_server; "
+                "from pwndoc_mcp_server.server import get_tool_definitions; "
+                "get_tool_definitions()",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        captured_output = result.stdout
+        if result.returncode != 0:
+            lines.append(f"   ERROR during import: {result.stderr.strip()}")
+    except Exception as e:
+        lines.append(f"   ERROR during import: {e}")
+
+    if captured_output:
+        lines.append(f"   ⚠️  STDOUT POLLUTION DETECTED! ({len(captured_output)} bytes)")
+        lines.append(f"   Content: {repr(captured_output[:200])}")
+        if len(captured_output) > 200:
+            lines.append(f"   ... (truncated, {len(captured_output) - 200} more bytes)")
+        lines.append("")
+    else:
+        lines.append("   ✅ No stdout pollution detected.\n")
+    return lines
+
+
+CHECKS = [
+    check_python,
+    check_installation,
+    check_module_location,
+    check_nuclear_fix,
+    check_claude_config,
+    check_stdout_pollution,
+]
+
+SUMMARY = """=== SUMMARY ===
+If you see 'Nuclear fix NOT found' above, you need to reinstall:
+  pip uninstall pwndoc-mcp-server -y
+  pip install pwndoc-mcp-server --force-reinstall --no-cache-dir
+
+If you see 'STDOUT POLLUTION DETECTED', please share the output with Claude.
+
+After any fixes, restart Claude Desktop completely.
+"""
+
+
+def main():
+    # The checks are independent and mostly I/O-bound (subprocess, directory
+    # scan, dist-info reads), so run them concurrently and report in order;
+    # total wall time is then roughly the slowest single check
+    results = [None] * len(CHECKS)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {pool.submit(check): i for i, check in enumerate(CHECKS)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = [f"{i + 1}. ERROR: {e}\n"]
+
+    # Windows consoles are slow per write() call, so flush the whole report
+    # with a single buffered write
+    out = ["=== PwnDoc MCP Server Diagnostic Tool ===\n"]
+    for lines in results:
+        out.extend(lines)
+    out.append(SUMMARY)
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()